@@ -0,0 +1,11 @@
+import logging
+
+from google.protobuf.internal import api_implementation
+
+# The generated modules require protobuf >= 6.31.1, which uses the upb C extension by default.  The pure-Python
+# implementation is selected only when the extension is unavailable or PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python
+# is set, and is an order of magnitude slower at (de)serializing every request and response.
+if api_implementation.Type() == "python":
+    logging.getLogger(__name__).warning(
+        "protobuf is using the pure-Python implementation; install a protobuf>=6.31.1 wheel with the upb extension "
+        "(and unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION) for faster gRPC message serialization")
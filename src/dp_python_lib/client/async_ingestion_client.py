@@ -0,0 +1,102 @@
+from typing import List, Union
+from dp_python_lib.client.ingestion_client import (
+    IngestionClientBase,
+    RegisterProviderRequestParams,
+    BatchRegisterProviderRequestParams,
+    RegisterProviderApiResult,
+    DEFAULT_REGISTER_PROVIDER_BATCH_SIZE,
+)
+from dp_python_lib.client.service_api_client_base import ChannelPool
+from dp_python_lib.grpc import ingestion_pb2
+import asyncio
+import grpc
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class AsyncIngestionClient(IngestionClientBase):
+    """
+    asyncio version of the user-facing Ingestion Service API class.  It must be created with a grpc.aio channel
+    (e.g., from MldpConfig.create_ingestion_aio_channel()), and its API methods are coroutines, so many calls can be
+    outstanding at once without a thread per call.  Request building and result handling are shared with
+    IngestionClient through IngestionClientBase.
+    """
+
+    def __init__(self, channel: Union[grpc.aio.Channel, ChannelPool], cache_registrations: bool = False) -> None:
+        """
+        :param channel: grpc.aio communication channel, or ChannelPool of grpc.aio channels (closed with
+            ChannelPool.aclose()), for Ingestion Service.
+        :param cache_registrations: If True, up to REGISTRATION_CACHE_SIZE of the most recently used successful
+            registerProvider() results are remembered, as for IngestionClient.
+        """
+        super().__init__(channel, cache_registrations)
+        self.logger = _logger
+        self.logger.debug("AsyncIngestionClient initialized with channel: %s", channel)
+
+    async def _send_register_provider(self, request: ingestion_pb2.RegisterProviderRequest) -> RegisterProviderApiResult:
+        """
+        Invokes the registerProvider() API method with the supplied request object.
+        :param request: RegisterProviderRequest object with parameters for call to registerProvider().
+        :return: Returns a RegisterProviderApiResult with the method response and status information.
+        """
+        cache_key = self._registration_cache_key(request)
+        cached_result = self._get_cached_registration(request, cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        self.logger.info("Calling registerProvider API for provider: %s", request.providerName)
+        ingestion_stub = self._next_stub()
+
+        try:
+            self.logger.debug("Awaiting ingestion_stub.registerProvider with request")
+            response = await ingestion_stub.registerProvider(request)
+            self.logger.debug("Received response from registerProvider API")
+            result = self._handle_register_provider_response(request, response)
+        except grpc.RpcError as e:
+            result = self._handle_register_provider_grpc_error(e)
+        except Exception as e:
+            result = self._handle_register_provider_unexpected_error(e)
+        self._cache_registration(cache_key, result)
+        return result
+
+    async def _send_register_providers(self, requests: List[ingestion_pb2.RegisterProviderRequest]) -> List[RegisterProviderApiResult]:
+        """
+        Invokes the registerProvider() API method concurrently for each of the supplied request objects.
+        :param requests: List of RegisterProviderRequest objects with parameters for calls to registerProvider().
+        :return: Returns a list of RegisterProviderApiResult objects, in the same order as the supplied requests.
+        """
+        self.logger.info("Calling registerProvider API for batch of %d providers", len(requests))
+        return list(await asyncio.gather(*[self._send_register_provider(request) for request in requests]))
+
+    async def register_provider(self, request_params: RegisterProviderRequestParams) -> RegisterProviderApiResult:
+        """
+        User facing coroutine for invoking the registerProvider() API method.
+        :param request_params: Contains user parameters for call to registerProvider() API method.
+        :return: Returns RegisterProviderApiResult with the method response and status information.
+        """
+        self.logger.info("Starting registerProvider operation for provider: %s", request_params.name)
+
+        request = self._build_register_provider_request(request_params)
+        result = await self._send_register_provider(request)
+        self._log_register_provider_result(request_params, result)
+        return result
+
+    async def register_providers(self, request_params_list: Union[List[RegisterProviderRequestParams], BatchRegisterProviderRequestParams], batch_size: int = DEFAULT_REGISTER_PROVIDER_BATCH_SIZE) -> List[RegisterProviderApiResult]:
+        """
+        User facing coroutine for invoking the registerProvider() API method for multiple providers.  Up to
+        batch_size calls are awaited concurrently.
+        :param request_params_list: List of user parameters, one per call to registerProvider() API method, or a
+            BatchRegisterProviderRequestParams object with parallel lists of parameters.
+        :param batch_size: Maximum number of registerProvider() calls in flight at once.
+        :return: Returns a list of RegisterProviderApiResult objects, in the same order as request_params_list.
+        """
+        self._check_batch_size(batch_size)
+        self.logger.info("Starting registerProvider operation for %d providers (batch_size=%d)", len(request_params_list), batch_size)
+
+        results = []
+        for requests in self._build_register_provider_request_batches(request_params_list, batch_size):
+            results.extend(await self._send_register_providers(requests))
+
+        self._log_register_providers_results(results)
+        return results
@@ -1,11 +1,38 @@
-from typing import Optional, Dict, List
-from dp_python_lib.client.service_api_client_base import ServiceApiClientBase
+from typing import Optional, Dict, List, Callable, Iterator, Union
+from collections import OrderedDict
+from dp_python_lib.client.service_api_client_base import ServiceApiClientBase, ChannelPool
 from dp_python_lib.client.result import ApiResultBase
 from dp_python_lib.grpc import ingestion_pb2_grpc
 from dp_python_lib.grpc import ingestion_pb2
 from dp_python_lib.grpc import common_pb2
+import functools
 import grpc
 import logging
+import threading
+
+_logger = logging.getLogger(__name__)
+
+
+# Default number of registerProvider() calls kept in flight by IngestionClient.register_providers().
+DEFAULT_REGISTER_PROVIDER_BATCH_SIZE = 32
+
+# Maximum number of distinct attribute name/value pairs whose encoding is cached by _encode_attribute().
+ATTRIBUTE_ENCODING_CACHE_SIZE = 4096
+
+# Maximum number of successful registerProvider() results remembered by a client created with cache_registrations=True.
+REGISTRATION_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=ATTRIBUTE_ENCODING_CACHE_SIZE)
+def _encode_attribute(name: str, value: str) -> bytes:
+    """
+    Returns the wire encoding of a single RegisterProviderRequest.attributes entry, including its field tag, for
+    merging into a RegisterProviderRequest with MergeFromString().
+    :param name: Attribute name.
+    :param value: Attribute value.
+    :return: Returns the serialized attributes field.
+    """
+    return ingestion_pb2.RegisterProviderRequest(attributes=[common_pb2.Attribute(name=name, value=value)]).SerializeToString()
 
 
 class RegisterProviderRequestParams:
@@ -13,6 +40,8 @@ class RegisterProviderRequestParams:
     Encapsulates client parameters for call to registerProvider() API method.
     """
 
+    __slots__ = ('name', 'description', 'tag_list', 'attribute_map')
+
     def __init__(self, name: str, description: Optional[str], tag_list: Optional[List[str]], attribute_map: Optional[Dict[str, str]]) -> None:
         """
         :param name: Data provider name.
@@ -25,11 +54,41 @@ class RegisterProviderRequestParams:
         self.tag_list = tag_list
         self.attribute_map = attribute_map
 
+class BatchRegisterProviderRequestParams:
+    """
+    Encapsulates client parameters for multiple calls to registerProvider() API method, stored as parallel lists
+    (one list per parameter) rather than as a list of RegisterProviderRequestParams objects.  This avoids creating a
+    params object per provider when registering providers in bulk.
+    """
+
+    __slots__ = ('names', 'descriptions', 'tag_lists', 'attribute_maps')
+
+    def __init__(self, names: List[str], descriptions: Optional[List[Optional[str]]] = None, tag_lists: Optional[List[Optional[List[str]]]] = None, attribute_maps: Optional[List[Optional[Dict[str, str]]]] = None) -> None:
+        """
+        :param names: Data provider names.
+        :param descriptions: Data provider descriptions, parallel to names, or None if no provider has a description.
+        :param tag_lists: Lists of tags (keywords) describing each provider, parallel to names, or None.
+        :param attribute_maps: Maps of key/value attributes describing each provider, parallel to names, or None.
+        """
+        count = len(names)
+        self.names = names
+        self.descriptions = descriptions if descriptions is not None else [None] * count
+        self.tag_lists = tag_lists if tag_lists is not None else [None] * count
+        self.attribute_maps = attribute_maps if attribute_maps is not None else [None] * count
+
+        if not (len(self.descriptions) == len(self.tag_lists) == len(self.attribute_maps) == count):
+            raise ValueError("names, descriptions, tag_lists and attribute_maps must all have the same length")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
 class RegisterProviderApiResult(ApiResultBase):
     """
     Wraps the response from registerProvider(), with a status object including an error flag and message.
     """
 
+    __slots__ = ('response',)
+
     def __init__(self, is_error: bool, message: str, response: Optional[ingestion_pb2.RegisterProviderResponse] = None) -> None:
         """
         :param is_error: Boolean flag indicating if an error occurrent id API call.
@@ -39,19 +98,37 @@ class RegisterProviderApiResult(ApiResultBase):
         super().__init__(is_error, message)
         self.response = response
 
-class IngestionClient(ServiceApiClientBase):
+class IngestionClientBase(ServiceApiClientBase):
     """
-    This is the user-facing Ingestion Service API class.  It provides methods and utility classes for calling
-    Ingestion Service methods.
+    This is the base class for the Ingestion Service API clients.  It contains the request building, result handling,
+    registration caching and logging shared by IngestionClient and AsyncIngestionClient, which add the blocking and
+    asyncio versions of the API methods, respectively.
     """
 
-    def __init__(self, channel: grpc.Channel) -> None:
+    def __init__(self, channel: Union[grpc.Channel, grpc.aio.Channel, ChannelPool], cache_registrations: bool = False) -> None:
         """
-        :param channel: gRPC communication channel for Ingestion Service.
+        :param channel: gRPC communication channel (blocking or grpc.aio), or ChannelPool, for Ingestion Service.
+        :param cache_registrations: If True, up to REGISTRATION_CACHE_SIZE of the most recently used successful
+            registerProvider() results are remembered, and registering a provider again with identical parameters
+            returns the remembered result without calling the Ingestion Service.
         """
         super().__init__(channel)
-        self.logger = logging.getLogger(__name__)
-        self.logger.debug("IngestionClient initialized with channel: %s", channel)
+        self.logger = _logger
+        # Stubs are built once per pooled channel rather than on every call
+        self._stubs = {
+            pooled_channel: ingestion_pb2_grpc.DpIngestionServiceStub(pooled_channel)
+            for pooled_channel in self._channel_pool.channels
+        }
+        # LRU cache keyed by serialized RegisterProviderRequest, which captures every parameter of the call
+        self._registration_cache: Optional[OrderedDict[bytes, RegisterProviderApiResult]] = OrderedDict() if cache_registrations else None
+        # The LRU lookup/update steps are not atomic, and a client may be shared by threads (e.g., with a ChannelPool)
+        self._registration_cache_lock = threading.Lock()
+
+    def _next_stub(self) -> ingestion_pb2_grpc.DpIngestionServiceStub:
+        """
+        Returns the cached DpIngestionServiceStub for the next channel in the client's channel pool.
+        """
+        return self._stubs[self._next_channel()]
 
     def _build_register_provider_request(self, request_params: RegisterProviderRequestParams) -> ingestion_pb2.RegisterProviderRequest:
         """
@@ -59,91 +136,281 @@ class IngestionClient(ServiceApiClientBase):
         :param request_params: A RegisterProviderRequestParams object containing the user parameters for call to registerProvider() API method.
         :return: Returns a RegisterProviderRequest API object for the specified params.
         """
-        self.logger.debug("Building RegisterProviderRequest for provider: %s", request_params.name)
-        
+        return self._build_register_provider_request_from_fields(
+            request_params.name, request_params.description, request_params.tag_list, request_params.attribute_map)
+
+    def _build_register_provider_request_from_fields(self, name: str, description: Optional[str], tag_list: Optional[List[str]], attribute_map: Optional[Dict[str, str]]) -> ingestion_pb2.RegisterProviderRequest:
+        """
+        Builds a RegisterProviderRequest API object from individual parameter values.
+        :param name: Data provider name.
+        :param description: Data provider description.
+        :param tag_list: List of tags (keywords) describing provider.
+        :param attribute_map: Map of key/value attributes describing provider.
+        :return: Returns a RegisterProviderRequest API object for the specified values.
+        """
         request = ingestion_pb2.RegisterProviderRequest()
-        request.providerName = request_params.name
+        request.providerName = name
 
-        if request_params.description:
-            self.logger.debug("Adding description: %s", request_params.description)
-            request.description = request_params.description
+        if description:
+            request.description = description
 
-        if request_params.tag_list:
-            self.logger.debug("Adding %d tags: %s", len(request_params.tag_list), request_params.tag_list)
-            request.tags[:] = request_params.tag_list
+        if tag_list:
+            request.tags.extend(tag_list)
 
-        if request_params.attribute_map:
-            self.logger.debug("Adding %d attributes: %s", len(request_params.attribute_map), list(request_params.attribute_map.keys()))
-            for name, value in request_params.attribute_map.items():
-                attribute = common_pb2.Attribute()
-                attribute.name = name
-                attribute.value = value
-                request.attributes.append(attribute)
+        if attribute_map:
+            # Attributes are merged from their cached wire encoding, so attributes shared by many providers are only
+            # encoded once
+            request.MergeFromString(b"".join([_encode_attribute(attribute_name, value) for attribute_name, value in attribute_map.items()]))
 
-        self.logger.debug("RegisterProviderRequest built successfully")
+        # Single guarded log call, so the argument formatting is skipped entirely unless debug logging is enabled
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Built RegisterProviderRequest for provider: %s (description: %s, tags: %s, attributes: %s)",
+                              request.providerName, request.description, list(request.tags),
+                              [attribute.name for attribute in request.attributes])
         return request
 
-    def _send_register_provider(self, request: ingestion_pb2.RegisterProviderRequest) -> RegisterProviderApiResult:
+    def _registration_cache_key(self, request: ingestion_pb2.RegisterProviderRequest) -> Optional[bytes]:
         """
-        Invokes the registerProvider() API method with the supplied request object.
-        :param request: RegisgerProviderRequest object with parameters for call to registerProvider().
+        Returns the registration cache key for a registerProvider() request, which is computed once per call and
+        passed to _get_cached_registration() and _cache_registration().
+        :param request: RegisterProviderRequest object for the call.
+        :return: Returns the deterministic serialization of the request, or None if registration caching is disabled.
+        """
+        if self._registration_cache is None:
+            return None
+        return request.SerializeToString(deterministic=True)
+
+    def _get_cached_registration(self, request: ingestion_pb2.RegisterProviderRequest, key: Optional[bytes]) -> Optional[RegisterProviderApiResult]:
+        """
+        Returns the remembered result of an earlier successful registerProvider() call with the same request, if
+        registration caching is enabled.
+        :param request: RegisterProviderRequest object to look up.
+        :param key: Cache key returned by _registration_cache_key() for the request.
+        :return: Returns the cached RegisterProviderApiResult, or None if there is none.
+        """
+        if key is None:
+            return None
+        with self._registration_cache_lock:
+            result = self._registration_cache.get(key)
+            if result is not None:
+                self._registration_cache.move_to_end(key)
+        if result is not None:
+            self.logger.info("Using cached registerProvider result for provider: %s", request.providerName)
+        return result
+
+    def _cache_registration(self, key: Optional[bytes], result: RegisterProviderApiResult) -> None:
+        """
+        Remembers the result of a successful registerProvider() call, if registration caching is enabled, evicting
+        the least recently used result once REGISTRATION_CACHE_SIZE results are cached.  Errors are not cached, so a
+        failed registration is retried on the next call.
+        :param key: Cache key returned by _registration_cache_key() for the request sent to registerProvider().
+        :param result: RegisterProviderApiResult for the call.
+        """
+        if key is None or result.result_status.is_error:
+            return
+        with self._registration_cache_lock:
+            self._registration_cache[key] = result
+            self._registration_cache.move_to_end(key)
+            if len(self._registration_cache) > REGISTRATION_CACHE_SIZE:
+                self._registration_cache.popitem(last=False)
+
+    def _handle_register_provider_response(self, request: ingestion_pb2.RegisterProviderRequest, response: ingestion_pb2.RegisterProviderResponse) -> RegisterProviderApiResult:
+        """
+        Converts a RegisterProviderResponse to a RegisterProviderApiResult, checking for business logic errors.
+        :param request: RegisterProviderRequest object that was sent to registerProvider().
+        :param response: RegisterProviderResponse object returned by registerProvider().
         :return: Returns a RegisterProviderApiResult with the method response and status information.
         """
-        self.logger.info("Calling registerProvider API for provider: %s", request.providerName)
-        ingestion_stub = ingestion_pb2_grpc.DpIngestionServiceStub(self._channel)
-        
-        try:
-            self.logger.debug("Invoking ingestion_stub.registerProvider with request")
-            response = ingestion_stub.registerProvider(request)
-            self.logger.debug("Received response from registerProvider API")
-            
-            # Check if response contains an exceptional result (error)
-            if response.HasField('exceptionalResult'):
-                error_msg = response.exceptionalResult.message
-                self.logger.warning("RegisterProvider API returned business error: %s", error_msg)
-                return RegisterProviderApiResult(
-                    is_error=True, 
-                    message=error_msg
-                )
-            
-            # Check if response contains registration result (success)
-            elif response.HasField('registrationResult'):
-                self.logger.info("Successfully registered provider: %s", request.providerName)
-                return RegisterProviderApiResult(
-                    is_error=False, 
-                    message="", 
-                    response=response
-                )
-            
-            # Unexpected response structure
-            else:
-                error_msg = "Unexpected response format: neither exceptionalResult nor registrationResult found"
-                self.logger.error(error_msg)
-                return RegisterProviderApiResult(
-                    is_error=True, 
-                    message=error_msg
-                )
-                
-        except grpc.RpcError as e:
-            error_msg = f"gRPC error: {e.details()}"
-            # Safely get error code - may not be available in test mocks
-            try:
-                error_code = e.code()
-                self.logger.error("gRPC error during registerProvider: %s (code: %s)", e.details(), error_code)
-            except (AttributeError, TypeError):
-                self.logger.error("gRPC error during registerProvider: %s", e.details())
+        # Check if response contains an exceptional result (error)
+        if response.HasField('exceptionalResult'):
+            error_msg = response.exceptionalResult.message
+            self.logger.warning("RegisterProvider API returned business error: %s", error_msg)
             return RegisterProviderApiResult(
                 is_error=True, 
                 message=error_msg
             )
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
-            self.logger.error("Unexpected error during registerProvider: %s", str(e), exc_info=True)
+        
+        # Check if response contains registration result (success)
+        elif response.HasField('registrationResult'):
+            self.logger.info("Successfully registered provider: %s", request.providerName)
+            return RegisterProviderApiResult(
+                is_error=False, 
+                message="", 
+                response=response
+            )
+        
+        # Unexpected response structure
+        else:
+            error_msg = "Unexpected response format: neither exceptionalResult nor registrationResult found"
+            self.logger.error(error_msg)
             return RegisterProviderApiResult(
                 is_error=True, 
                 message=error_msg
             )
 
+    def _handle_register_provider_grpc_error(self, e: grpc.RpcError) -> RegisterProviderApiResult:
+        """
+        Converts a gRPC error raised by registerProvider() to a RegisterProviderApiResult.
+        :param e: The grpc.RpcError raised by the API call.
+        :return: Returns a RegisterProviderApiResult with error status information.
+        """
+        error_msg = f"gRPC error: {e.details()}"
+        # Safely get error code - may not be available in test mocks
+        try:
+            error_code = e.code()
+            self.logger.error("gRPC error during registerProvider: %s (code: %s)", e.details(), error_code)
+        except (AttributeError, TypeError):
+            self.logger.error("gRPC error during registerProvider: %s", e.details())
+        return RegisterProviderApiResult(
+            is_error=True, 
+            message=error_msg
+        )
+
+    def _handle_register_provider_unexpected_error(self, e: Exception) -> RegisterProviderApiResult:
+        """
+        Converts an unexpected exception raised while calling registerProvider() to a RegisterProviderApiResult.
+        :param e: The exception raised by the API call.
+        :return: Returns a RegisterProviderApiResult with error status information.
+        """
+        error_msg = f"Unexpected error: {str(e)}"
+        self.logger.error("Unexpected error during registerProvider: %s", str(e), exc_info=True)
+        return RegisterProviderApiResult(
+            is_error=True, 
+            message=error_msg
+        )
+
+    @staticmethod
+    def _check_batch_size(batch_size: int) -> None:
+        """
+        Validates the batch_size parameter for register_providers().
+        :param batch_size: Maximum number of registerProvider() calls in flight at once.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive: {batch_size}")
+
+    def _build_register_provider_request_batches(self, request_params_list: Union[List[RegisterProviderRequestParams], BatchRegisterProviderRequestParams], batch_size: int) -> Iterator[List[ingestion_pb2.RegisterProviderRequest]]:
+        """
+        Builds RegisterProviderRequest API objects for register_providers(), yielding them in lists of up to batch_size.
+        Each batch is built only when the previous one has been sent.
+        :param request_params_list: List of RegisterProviderRequestParams, or a BatchRegisterProviderRequestParams.
+        :param batch_size: Maximum number of requests per batch.
+        :return: Yields lists of RegisterProviderRequest objects, in the order of request_params_list.
+        """
+        for start in range(0, len(request_params_list), batch_size):
+            stop = start + batch_size
+            if isinstance(request_params_list, BatchRegisterProviderRequestParams):
+                yield [
+                    self._build_register_provider_request_from_fields(name, description, tag_list, attribute_map)
+                    for name, description, tag_list, attribute_map in zip(
+                        request_params_list.names[start:stop], request_params_list.descriptions[start:stop],
+                        request_params_list.tag_lists[start:stop], request_params_list.attribute_maps[start:stop])
+                ]
+            else:
+                yield [self._build_register_provider_request(request_params) for request_params in request_params_list[start:stop]]
+
+    def _log_register_provider_result(self, request_params: RegisterProviderRequestParams, result: RegisterProviderApiResult) -> None:
+        """
+        Logs the outcome of a register_provider() operation.
+        :param request_params: User parameters for the registerProvider() call.
+        :param result: RegisterProviderApiResult returned for the call.
+        """
+        if result.result_status.is_error:
+            self.logger.error("RegisterProvider operation failed: %s", result.result_status.message)
+        else:
+            self.logger.info("RegisterProvider operation completed successfully for provider: %s", request_params.name)
+
+    def _log_register_providers_results(self, results: List[RegisterProviderApiResult]) -> None:
+        """
+        Logs the outcome of a register_providers() operation.
+        :param results: RegisterProviderApiResult objects returned for the calls.
+        """
+        error_count = sum(1 for result in results if result.result_status.is_error)
+        if error_count:
+            self.logger.error("RegisterProvider operation failed for %d of %d providers", error_count, len(results))
+        else:
+            self.logger.info("RegisterProvider operation completed successfully for %d providers", len(results))
+
+class IngestionClient(IngestionClientBase):
+    """
+    This is the user-facing Ingestion Service API class.  It provides methods and utility classes for calling
+    Ingestion Service methods.
+    """
+
+    def __init__(self, channel: Union[grpc.Channel, ChannelPool], cache_registrations: bool = False) -> None:
+        """
+        :param channel: gRPC communication channel, or ChannelPool, for Ingestion Service.
+        :param cache_registrations: If True, up to REGISTRATION_CACHE_SIZE of the most recently used successful
+            registerProvider() results are remembered, and registering a provider again with identical parameters
+            returns the remembered result without calling the Ingestion Service.
+        """
+        super().__init__(channel, cache_registrations)
+        self.logger.debug("IngestionClient initialized with channel: %s", channel)
+
+    def _send_register_provider(self, request: ingestion_pb2.RegisterProviderRequest) -> RegisterProviderApiResult:
+        """
+        Invokes the registerProvider() API method with the supplied request object.
+        :param request: RegisgerProviderRequest object with parameters for call to registerProvider().
+        :return: Returns a RegisterProviderApiResult with the method response and status information.
+        """
+        cache_key = self._registration_cache_key(request)
+        cached_result = self._get_cached_registration(request, cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        self.logger.info("Calling registerProvider API for provider: %s", request.providerName)
+        ingestion_stub = self._next_stub()
+        self.logger.debug("Invoking ingestion_stub.registerProvider with request")
+        result = self._resolve_register_provider(request, functools.partial(ingestion_stub.registerProvider, request))
+        self._cache_registration(cache_key, result)
+        return result
+
+    def _send_register_providers(self, requests: List[ingestion_pb2.RegisterProviderRequest]) -> List[RegisterProviderApiResult]:
+        """
+        Invokes the registerProvider() API method for each of the supplied request objects.  All requests are issued
+        before any response is awaited, so the calls are pipelined over the channel instead of paying a full round
+        trip per provider.
+        :param requests: List of RegisterProviderRequest objects with parameters for calls to registerProvider().
+        :return: Returns a list of RegisterProviderApiResult objects, in the same order as the supplied requests.
+        """
+        cache_keys = [self._registration_cache_key(request) for request in requests]
+        results = [self._get_cached_registration(request, cache_key) for request, cache_key in zip(requests, cache_keys)]
+        uncached = [(index, request) for index, (request, result) in enumerate(zip(requests, results)) if result is None]
+        if not uncached:
+            return results
+
+        self.logger.info("Calling registerProvider API for batch of %d providers", len(uncached))
+        futures = []
+        for index, request in uncached:
+            # Issuing the call can itself fail (e.g., on a closed channel), which becomes that request's result
+            # rather than abandoning the calls already issued for the batch.  Each call takes the next pooled
+            # channel, so a ChannelPool spreads the batch across its connections.
+            try:
+                futures.append((index, request, self._next_stub().registerProvider.future(request)))
+            except grpc.RpcError as e:
+                results[index] = self._handle_register_provider_grpc_error(e)
+            except Exception as e:
+                results[index] = self._handle_register_provider_unexpected_error(e)
+        for index, request, future in futures:
+            results[index] = self._resolve_register_provider(request, future.result)
+            self._cache_registration(cache_keys[index], results[index])
+        return results
+
+    def _resolve_register_provider(self, request: ingestion_pb2.RegisterProviderRequest, get_response: Callable[[], ingestion_pb2.RegisterProviderResponse]) -> RegisterProviderApiResult:
+        """
+        Waits for the response to a registerProvider() API call and converts it to a RegisterProviderApiResult.
+        :param request: RegisterProviderRequest object that was sent to registerProvider().
+        :param get_response: Callable that returns the RegisterProviderResponse, or raises if the call failed.
+        :return: Returns a RegisterProviderApiResult with the method response and status information.
+        """
+        try:
+            response = get_response()
+            self.logger.debug("Received response from registerProvider API")
+            return self._handle_register_provider_response(request, response)
+        except grpc.RpcError as e:
+            return self._handle_register_provider_grpc_error(e)
+        except Exception as e:
+            return self._handle_register_provider_unexpected_error(e)
+
     def register_provider(self, request_params: RegisterProviderRequestParams) -> RegisterProviderApiResult:
         """
         User facing method for invoking the registerProvider() API method.
@@ -154,13 +421,25 @@ class IngestionClient(ServiceApiClientBase):
         
         request = self._build_register_provider_request(request_params)
         result = self._send_register_provider(request)
-        
-        if result.result_status.is_error:
-            self.logger.error("RegisterProvider operation failed: %s", result.result_status.message)
-        else:
-            self.logger.info("RegisterProvider operation completed successfully for provider: %s", request_params.name)
-            
+        self._log_register_provider_result(request_params, result)
         return result
 
+    def register_providers(self, request_params_list: Union[List[RegisterProviderRequestParams], BatchRegisterProviderRequestParams], batch_size: int = DEFAULT_REGISTER_PROVIDER_BATCH_SIZE) -> List[RegisterProviderApiResult]:
+        """
+        User facing method for invoking the registerProvider() API method for multiple providers.  Requests are sent
+        in batches of up to batch_size outstanding calls, which amortizes the per-call round trip compared to calling
+        register_provider() in a loop.
+        :param request_params_list: List of user parameters, one per call to registerProvider() API method, or a
+            BatchRegisterProviderRequestParams object with parallel lists of parameters.
+        :param batch_size: Maximum number of registerProvider() calls in flight at once.
+        :return: Returns a list of RegisterProviderApiResult objects, in the same order as request_params_list.
+        """
+        self._check_batch_size(batch_size)
+        self.logger.info("Starting registerProvider operation for %d providers (batch_size=%d)", len(request_params_list), batch_size)
 
+        results = []
+        for requests in self._build_register_provider_request_batches(request_params_list, batch_size):
+            results.extend(self._send_register_providers(requests))
 
+        self._log_register_providers_results(results)
+        return results
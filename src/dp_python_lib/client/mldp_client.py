@@ -1,9 +1,14 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
 import grpc
 import logging
 
 from dp_python_lib.client.ingestion_client import IngestionClient
-from dp_python_lib.config import MldpConfig, load_config
+from dp_python_lib.client.service_api_client_base import ChannelPool
+
+if TYPE_CHECKING:
+    from dp_python_lib.config import MldpConfig
+
+_logger = logging.getLogger(__name__)
 
 
 class MldpClient:
@@ -14,31 +19,34 @@ class MldpClient:
     """
 
     def __init__(self, 
-                 ingestion_channel: Optional[grpc.Channel] = None,
-                 query_channel: Optional[grpc.Channel] = None,
-                 annotation_channel: Optional[grpc.Channel] = None,
-                 config: Optional[MldpConfig] = None,
+                 ingestion_channel: Optional[Union[grpc.Channel, ChannelPool]] = None,
+                 query_channel: Optional[Union[grpc.Channel, ChannelPool]] = None,
+                 annotation_channel: Optional[Union[grpc.Channel, ChannelPool]] = None,
+                 config: Optional['MldpConfig'] = None,
                  config_file: Optional[str] = None) -> None:
         """
         Initialize MLDP client with either explicit channels or configuration.
         
-        :param ingestion_channel: gRPC communication channel for Ingestion Service (optional)
-        :param query_channel: gRPC communication channel for Query Service (optional) 
-        :param annotation_channel: gRPC communication channel for Annotation Service (optional)
+        :param ingestion_channel: gRPC communication channel, or ChannelPool, for Ingestion Service (optional)
+        :param query_channel: gRPC communication channel, or ChannelPool, for Query Service (optional)
+        :param annotation_channel: gRPC communication channel, or ChannelPool, for Annotation Service (optional)
         :param config: Configuration object (optional)
         :param config_file: Path to YAML configuration file (optional)
         """
         
-        self.logger = logging.getLogger(__name__)
+        self.logger = _logger
         self.logger.debug("Initializing MldpClient with ingestion_channel=%s, query_channel=%s, annotation_channel=%s, config=%s, config_file=%s", 
                          ingestion_channel is not None, query_channel is not None, annotation_channel is not None, 
                          config is not None, config_file)
         
-        # Load configuration if not using explicit channels
+        # Load configuration if not using explicit channels.  The config package is imported here, rather than at
+        # module level, so that clients built only from explicit channels don't import pydantic-settings.
         if ingestion_channel is None and config is None:
+            from dp_python_lib.config import load_config
             self.logger.info("Loading default configuration with config_file: %s", config_file)
             config = load_config(config_file=config_file)
         elif config is None and config_file is not None:
+            from dp_python_lib.config import load_config
             self.logger.info("Loading configuration from file: %s", config_file)
             config = load_config(config_file=config_file)
             
@@ -46,6 +54,11 @@ class MldpClient:
         if ingestion_channel:
             self.logger.debug("Using explicit ingestion channel")
             self._ingestion_channel = ingestion_channel
+        elif config and config.ingestion.channel_pool_size > 1:
+            self.logger.info("Creating ingestion channel pool from config: %s:%s (TLS=%s, pool size=%d)", 
+                           config.ingestion.host, config.ingestion.port, config.ingestion.use_tls,
+                           config.ingestion.channel_pool_size)
+            self._ingestion_channel = config.create_ingestion_channel_pool()
         elif config:
             self.logger.info("Creating ingestion channel from config: %s:%s (TLS=%s)", 
                            config.ingestion.host, config.ingestion.port, config.ingestion.use_tls)
@@ -58,6 +71,11 @@ class MldpClient:
         if query_channel:
             self.logger.debug("Using explicit query channel")
             self._query_channel = query_channel
+        elif config and config.query.channel_pool_size > 1:
+            self.logger.debug("Creating query channel pool from config: %s:%s (TLS=%s, pool size=%d)", 
+                            config.query.host, config.query.port, config.query.use_tls,
+                            config.query.channel_pool_size)
+            self._query_channel = config.create_query_channel_pool()
         elif config:
             self.logger.debug("Creating query channel from config: %s:%s (TLS=%s)", 
                             config.query.host, config.query.port, config.query.use_tls)
@@ -70,6 +88,11 @@ class MldpClient:
         if annotation_channel:
             self.logger.debug("Using explicit annotation channel")
             self._annotation_channel = annotation_channel
+        elif config and config.annotation.channel_pool_size > 1:
+            self.logger.debug("Creating annotation channel pool from config: %s:%s (TLS=%s, pool size=%d)", 
+                            config.annotation.host, config.annotation.port, config.annotation.use_tls,
+                            config.annotation.channel_pool_size)
+            self._annotation_channel = config.create_annotation_channel_pool()
         elif config:
             self.logger.debug("Creating annotation channel from config: %s:%s (TLS=%s)", 
                             config.annotation.host, config.annotation.port, config.annotation.use_tls)
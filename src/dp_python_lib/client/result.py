@@ -7,6 +7,8 @@ class ResultStatus():
     of the operation, and a corresponding error message.
     """
 
+    __slots__ = ('is_error', 'message')
+
     def __init__(self, is_error: bool, message: str = "") -> None:
         """
         :param is_error: Boolean flag indicating success or failure of the API method call.
@@ -18,9 +20,12 @@ class ResultStatus():
 class ApiResultBase(ABC):
     """
     Abstract base class for returning information from service API method calls.  Concrete subclasses contain
-    details from the API method response, in addition to status information.
+    details from the API method response, in addition to status information.  Subclasses should declare __slots__
+    for their own attributes, since results are created for every API call.
     """
 
+    __slots__ = ('result_status',)
+
     def __init__(self, is_error: bool, message: str) -> None:
         """
         :param is_error: Boolean flag indicating success or failure of the API method call.
@@ -1,19 +1,80 @@
 from abc import ABC
+from typing import List, Tuple, Union
 import grpc
+import itertools
 import logging
 
+# Module-level logger shared by all instances, so constructing a client does not repeat the getLogger() lookup
+_logger = logging.getLogger(__name__)
+
+
+class ChannelPool():
+    """
+    Holds a fixed set of gRPC channels to the same service endpoint and hands them out in round-robin order, so that
+    concurrent callers spread their RPCs across multiple connections instead of sharing a single one.
+    """
+
+    def __init__(self, channels: List[grpc.Channel]) -> None:
+        """
+        :param channels: gRPC communication channels for the pool, all connected to the same Service.
+        """
+        if not channels:
+            raise ValueError("ChannelPool requires at least one channel")
+        self._channels = list(channels)
+        # next() on itertools.count is atomic under the GIL, so no lock is needed for round-robin selection
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    @property
+    def channels(self) -> Tuple[grpc.Channel, ...]:
+        """
+        Returns all channels in the pool.
+        """
+        return tuple(self._channels)
+
+    def get(self) -> grpc.Channel:
+        """
+        Returns the next channel in round-robin order.
+        """
+        return self._channels[next(self._counter) % len(self._channels)]
+
+    def close(self) -> None:
+        """
+        Closes all channels in a pool of blocking gRPC channels.  Use aclose() for grpc.aio channels.
+        """
+        for channel in self._channels:
+            channel.close()
+
+    async def aclose(self) -> None:
+        """
+        Closes all channels in a pool of grpc.aio channels, whose close() is a coroutine.
+        """
+        for channel in self._channels:
+            await channel.close()
+
 
 class ServiceApiClientBase(ABC):
     """
     This is the base class for the various service client classes.  It contains a constructor to save the specified
-    channel to an instance variable.
+    channel (or pool of channels) to instance variables.
     """
 
-    def __init__(self, channel: grpc.Channel) -> None:
+    def __init__(self, channel: Union[grpc.Channel, ChannelPool]) -> None:
         """
-        :param channel: gRPC communication channel for the client's backend Service.
+        :param channel: gRPC communication channel, or ChannelPool, for the client's backend Service.
         """
-        self.logger = logging.getLogger(__name__)
-        self._channel = channel
-        self.logger.debug("Initialized service client with channel: %s", channel)
+        self.logger = _logger
+        if isinstance(channel, ChannelPool):
+            self._channel_pool = channel
+        else:
+            self._channel_pool = ChannelPool([channel])
+        self._channel = self._channel_pool.get()
+        self.logger.debug("Initialized service client with channel: %s (pool size: %d)", channel, len(self._channel_pool))
 
+    def _next_channel(self) -> grpc.Channel:
+        """
+        Returns the channel to use for the next RPC, rotating through the client's channel pool.
+        """
+        return self._channel_pool.get()
@@ -1,4 +1,30 @@
-from .config import ServiceConfig, MldpConfig
-from .loader import load_config
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ['ServiceConfig', 'MldpConfig', 'load_config']
\ No newline at end of file
+__all__ = ['ServiceConfig', 'MldpConfig', 'load_config', 'clear_config_cache']
+
+# pydantic-settings is slow to import relative to the rest of the library, so the public names are resolved on first
+# use (PEP 562).  Clients created with explicit channels never pay for it.
+_LAZY_ATTRIBUTES = {
+    'ServiceConfig': '.config',
+    'MldpConfig': '.config',
+    'load_config': '.loader',
+    'clear_config_cache': '.loader',
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .config import ServiceConfig, MldpConfig
+    from .loader import load_config, clear_config_cache
@@ -1,31 +1,106 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional
-import grpc
+from typing import TYPE_CHECKING, Optional, List, Tuple, Dict, Union, Any
+import json
 import logging
 
+if TYPE_CHECKING:
+    import grpc
+    import grpc.aio
+    from dp_python_lib.client.service_api_client_base import ChannelPool
+
+_logger = logging.getLogger(__name__)
+
+
+# gRPC channel arguments applied to every channel, which can be overridden per service via channel_options.
+# Keepalive pings are kept to the 5 minute minimum interval that grpc-java servers accept by default (more frequent
+# pings, or pings without active calls, are answered with a GOAWAY), and the receive limit is raised from the 4 MB
+# default so large responses are not rejected.
+DEFAULT_CHANNEL_OPTIONS: Dict[str, Union[int, str]] = {
+    "grpc.max_send_message_length": 64 * 1024 * 1024,
+    "grpc.max_receive_message_length": 64 * 1024 * 1024,
+    "grpc.keepalive_time_ms": 300000,
+    "grpc.keepalive_timeout_ms": 20000,
+    "grpc.http2.bdp_probe": 1,
+}
+
+# Gives each pooled channel its own subchannel (and therefore its own TCP connection), instead of sharing the
+# process-wide subchannel pool, which would collapse the pool back onto a single connection.
+_POOLED_CHANNEL_OPTIONS = [("grpc.use_local_subchannel_pool", 1)]
+
+# Services configured by MldpConfig; each has flat '<service>_<setting>' fields and a cached ServiceConfig property.
+_SERVICES = ('ingestion', 'query', 'annotation')
+
+# Per-service settings read from each service's section of a YAML or JSON configuration file.
+_SERVICE_SETTINGS = ('host', 'port', 'use_tls', 'channel_pool_size', 'channel_options')
+
+# Sentinel for settings absent from a service section of a configuration file (None is a valid setting value).
+_MISSING = object()
+
 
 class ServiceConfig(BaseModel):
-    """Configuration for a single gRPC service.""" 
+    """Configuration for a single gRPC service (read-only; change MldpConfig's flat fields instead).""" 
     host: str = "localhost"
     port: int = 50051
     use_tls: bool = False
+    channel_pool_size: int = Field(default=1, ge=1)
+    # Stored as (name, value) pairs, rather than a dict, so that the options can't be changed in place either
+    channel_options: Tuple[Tuple[str, Union[int, str]], ...] = ()
+    
+    model_config = ConfigDict(frozen=True)
+    
+    @field_validator('channel_options', mode='before')
+    @classmethod
+    def _channel_options_to_pairs(cls, value: Any) -> Any:
+        """Accept channel_options as a dict, as in configuration files."""
+        if isinstance(value, dict):
+            return tuple(value.items())
+        return value
     
     def connection_string(self) -> str:
         """Generate connection string for this service."""
         return f"{self.host}:{self.port}"
     
-    def create_channel(self) -> grpc.Channel:
+    def build_channel_options(self, options: Optional[List[Tuple[str, Any]]] = None) -> List[Tuple[str, Any]]:
+        """Merge DEFAULT_CHANNEL_OPTIONS, this service's channel_options and any call-specific options, in that order."""
+        merged = dict(DEFAULT_CHANNEL_OPTIONS)
+        merged.update(self.channel_options)
+        if options:
+            merged.update(options)
+        return list(merged.items())
+    
+    def create_channel(self, options: Optional[List[Tuple[str, Any]]] = None) -> 'grpc.Channel':
         """Create a gRPC channel for this service."""
-        logger = logging.getLogger(__name__)
+        # grpc is imported on first use, so loading configuration alone doesn't pay for importing the gRPC runtime
+        import grpc
+        connection_str = self.connection_string()
+        options = self.build_channel_options(options)
+        
+        if self.use_tls:
+            _logger.debug("Creating secure gRPC channel to %s", connection_str)
+            return grpc.secure_channel(connection_str, grpc.ssl_channel_credentials(), options=options)
+        else:
+            _logger.debug("Creating insecure gRPC channel to %s", connection_str)
+            return grpc.insecure_channel(connection_str, options=options)
+    
+    def create_aio_channel(self, options: Optional[List[Tuple[str, Any]]] = None) -> 'grpc.aio.Channel':
+        """Create a grpc.aio (asyncio) channel for this service."""
+        import grpc.aio
         connection_str = self.connection_string()
+        options = self.build_channel_options(options)
         
         if self.use_tls:
-            logger.debug("Creating secure gRPC channel to %s", connection_str)
-            return grpc.secure_channel(connection_str, grpc.ssl_channel_credentials())
+            _logger.debug("Creating secure grpc.aio channel to %s", connection_str)
+            return grpc.aio.secure_channel(connection_str, grpc.ssl_channel_credentials(), options=options)
         else:
-            logger.debug("Creating insecure gRPC channel to %s", connection_str)
-            return grpc.insecure_channel(connection_str)
+            _logger.debug("Creating insecure grpc.aio channel to %s", connection_str)
+            return grpc.aio.insecure_channel(connection_str, options=options)
+    
+    def create_channel_pool(self) -> 'ChannelPool':
+        """Create a pool of channel_pool_size gRPC channels for this service, each with its own connection."""
+        from dp_python_lib.client.service_api_client_base import ChannelPool
+        _logger.debug("Creating pool of %d gRPC channels to %s", self.channel_pool_size, self.connection_string())
+        return ChannelPool([self.create_channel(options=_POOLED_CHANNEL_OPTIONS) for _ in range(self.channel_pool_size)])
 
 
 class MldpConfig(BaseSettings):
@@ -35,100 +110,135 @@ class MldpConfig(BaseSettings):
     ingestion_host: str = "localhost"
     ingestion_port: int = 50051
     ingestion_use_tls: bool = False
+    ingestion_channel_pool_size: int = Field(default=1, ge=1)
+    ingestion_channel_options: Dict[str, Union[int, str]] = Field(default_factory=dict)
     
     # Query service configuration  
     query_host: str = "localhost"
     query_port: int = 50052
     query_use_tls: bool = False
+    query_channel_pool_size: int = Field(default=1, ge=1)
+    query_channel_options: Dict[str, Union[int, str]] = Field(default_factory=dict)
     
     # Annotation service configuration
     annotation_host: str = "localhost" 
     annotation_port: int = 50053
     annotation_use_tls: bool = False
+    annotation_channel_pool_size: int = Field(default=1, ge=1)
+    annotation_channel_options: Dict[str, Union[int, str]] = Field(default_factory=dict)
     
     model_config = SettingsConfigDict(
         env_prefix='MLDP_',
         case_sensitive=False
     )
     
+    # ServiceConfig built for each service, with the flat field values it was built from
+    _service_configs: Dict[str, Tuple[Tuple[Any, ...], ServiceConfig]] = PrivateAttr(default_factory=dict)
+    
+    def _service_config(self, service: str) -> ServiceConfig:
+        """
+        Get the ServiceConfig for a service, built from its flat fields.  The ServiceConfig is cached, and rebuilt only
+        when one of those fields no longer has the value it was built from (including after model_copy(update=...) or
+        an in-place change to the channel_options dict).
+        """
+        host, port, use_tls, channel_pool_size, channel_options = (
+            getattr(self, f'{service}_{setting}') for setting in _SERVICE_SETTINGS)
+        values = (host, port, use_tls, channel_pool_size, tuple(channel_options.items()))
+        cached = self._service_configs.get(service)
+        if cached is not None and cached[0] == values:
+            return cached[1]
+        service_config = ServiceConfig(
+            host=host,
+            port=port,
+            use_tls=use_tls,
+            channel_pool_size=channel_pool_size,
+            channel_options=values[-1]
+        )
+        self._service_configs[service] = (values, service_config)
+        return service_config
+    
     @property
     def ingestion(self) -> ServiceConfig:
-        """Get ingestion service configuration."""
-        return ServiceConfig(
-            host=self.ingestion_host,
-            port=self.ingestion_port,
-            use_tls=self.ingestion_use_tls
-        )
+        """Get ingestion service configuration (cached until its fields change)."""
+        return self._service_config('ingestion')
     
-    @property  
+    @property
     def query(self) -> ServiceConfig:
-        """Get query service configuration."""
-        return ServiceConfig(
-            host=self.query_host,
-            port=self.query_port,
-            use_tls=self.query_use_tls
-        )
+        """Get query service configuration (cached until its fields change)."""
+        return self._service_config('query')
     
     @property
     def annotation(self) -> ServiceConfig:
-        """Get annotation service configuration.""" 
-        return ServiceConfig(
-            host=self.annotation_host,
-            port=self.annotation_port,
-            use_tls=self.annotation_use_tls
-        )
+        """Get annotation service configuration (cached until its fields change).""" 
+        return self._service_config('annotation')
     
     @classmethod
     def from_yaml(cls, yaml_file: str) -> 'MldpConfig':
-        """Load configuration from YAML file."""
-        import yaml
-        logger = logging.getLogger(__name__)
-        
+        """Load configuration from YAML file, or from a JSON file with the same structure if the name ends in .json."""
         try:
-            logger.info("Loading configuration from YAML file: %s", yaml_file)
-            with open(yaml_file, 'r') as f:
-                data = yaml.safe_load(f)
+            _logger.info("Loading configuration from file: %s", yaml_file)
+            with open(yaml_file, 'rb') as f:
+                if yaml_file.endswith('.json'):
+                    data = json.load(f)
+                else:
+                    import yaml
+                    # Use libyaml's C parser when PyYAML was built with it; the file is read as bytes, which libyaml
+                    # decodes
+                    data = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
             
-            # Convert nested YAML structure to flat fields
+            # Convert nested YAML/JSON structure to flat fields
             flat_data = {}
             
-            for service in ['ingestion', 'query', 'annotation']:
+            for service in _SERVICES:
                 if service in data:
                     service_config = data[service]
-                    if 'host' in service_config:
-                        flat_data[f'{service}_host'] = service_config['host']
-                        logger.debug("Loaded %s_host: %s", service, service_config['host'])
-                    if 'port' in service_config:
-                        flat_data[f'{service}_port'] = service_config['port']
-                        logger.debug("Loaded %s_port: %s", service, service_config['port'])
-                    if 'use_tls' in service_config:
-                        flat_data[f'{service}_use_tls'] = service_config['use_tls']
-                        logger.debug("Loaded %s_use_tls: %s", service, service_config['use_tls'])
+                    for setting in _SERVICE_SETTINGS:
+                        value = service_config.get(setting, _MISSING)
+                        if value is not _MISSING:
+                            flat_data[f'{service}_{setting}'] = value
+                            _logger.debug("Loaded %s_%s: %s", service, setting, value)
             
-            logger.debug("Successfully loaded configuration from YAML, creating MldpConfig instance")
+            _logger.debug("Successfully loaded configuration from %s, creating MldpConfig instance", yaml_file)
             return cls(**flat_data)
             
         except FileNotFoundError:
-            logger.warning("YAML configuration file not found: %s, using defaults", yaml_file)
+            _logger.warning("Configuration file not found: %s, using defaults", yaml_file)
             return cls()
         except Exception as e:
-            logger.error("Error loading configuration from %s: %s", yaml_file, e)
+            _logger.error("Error loading configuration from %s: %s", yaml_file, e)
             raise ValueError(f"Error loading configuration from {yaml_file}: {e}")
     
-    def create_ingestion_channel(self) -> grpc.Channel:
+    def create_ingestion_channel(self) -> 'grpc.Channel':
         """Create gRPC channel for ingestion service."""
-        logger = logging.getLogger(__name__)
-        logger.debug("Creating ingestion channel")
+        _logger.debug("Creating ingestion channel")
         return self.ingestion.create_channel()
     
-    def create_query_channel(self) -> grpc.Channel:
+    def create_ingestion_aio_channel(self) -> 'grpc.aio.Channel':
+        """Create grpc.aio (asyncio) channel for ingestion service, for use with AsyncIngestionClient."""
+        _logger.debug("Creating ingestion grpc.aio channel")
+        return self.ingestion.create_aio_channel()
+    
+    def create_ingestion_channel_pool(self) -> 'ChannelPool':
+        """Create pool of gRPC channels for ingestion service."""
+        _logger.debug("Creating ingestion channel pool")
+        return self.ingestion.create_channel_pool()
+    
+    def create_query_channel(self) -> 'grpc.Channel':
         """Create gRPC channel for query service."""
-        logger = logging.getLogger(__name__)
-        logger.debug("Creating query channel")
+        _logger.debug("Creating query channel")
         return self.query.create_channel()
     
-    def create_annotation_channel(self) -> grpc.Channel:
+    def create_query_channel_pool(self) -> 'ChannelPool':
+        """Create pool of gRPC channels for query service."""
+        _logger.debug("Creating query channel pool")
+        return self.query.create_channel_pool()
+    
+    def create_annotation_channel(self) -> 'grpc.Channel':
         """Create gRPC channel for annotation service."""
-        logger = logging.getLogger(__name__)
-        logger.debug("Creating annotation channel")
-        return self.annotation.create_channel()
\ No newline at end of file
+        _logger.debug("Creating annotation channel")
+        return self.annotation.create_channel()
+    
+    def create_annotation_channel_pool(self) -> 'ChannelPool':
+        """Create pool of gRPC channels for annotation service."""
+        _logger.debug("Creating annotation channel pool")
+        return self.annotation.create_channel_pool()
\ No newline at end of file
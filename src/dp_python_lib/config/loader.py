@@ -1,73 +1,91 @@
 import os
+import functools
 import logging
-from pathlib import Path
-from typing import Optional, Union
+from typing import Iterator, Optional, Tuple, Union
 from .config import MldpConfig
 
+_logger = logging.getLogger(__name__)
+
+# Default configuration file names, in order of preference.  JSON files parse faster than YAML, and are loaded by
+# MldpConfig.from_yaml() using the json module.
+CONFIG_FILE_NAMES = ("mldp-config.yaml", "mldp-config.json")
+
 
 def find_config_file(config_file: Optional[str] = None) -> Optional[str]:
     """
     Find configuration file in order of priority:
     1. Explicitly provided config_file parameter
     2. MLDP_CONFIG_FILE environment variable
-    3. mldp-config.yaml in current directory
-    4. mldp-config.yaml in project root (where pyproject.toml is)
+    3. mldp-config.yaml (or mldp-config.json) in current directory
+    4. mldp-config.yaml (or mldp-config.json) in project root (where pyproject.toml is)
     """
-    logger = logging.getLogger(__name__)
     
     if config_file:
-        logger.debug("Checking explicitly provided config file: %s", config_file)
+        _logger.debug("Checking explicitly provided config file: %s", config_file)
         if os.path.exists(config_file):
-            logger.info("Found explicit config file: %s", config_file)
+            _logger.info("Found explicit config file: %s", config_file)
             return config_file
         else:
-            logger.error("Specified config file not found: %s", config_file)
+            _logger.error("Specified config file not found: %s", config_file)
             raise FileNotFoundError(f"Specified config file not found: {config_file}")
     
     # Check environment variable
     env_config = os.getenv('MLDP_CONFIG_FILE')
     if env_config:
-        logger.debug("Found MLDP_CONFIG_FILE environment variable: %s", env_config)
+        _logger.debug("Found MLDP_CONFIG_FILE environment variable: %s", env_config)
         if os.path.exists(env_config):
-            logger.info("Using config file from environment variable: %s", env_config)
+            _logger.info("Using config file from environment variable: %s", env_config)
             return env_config
         else:
-            logger.warning("Config file from environment variable does not exist: %s", env_config)
+            _logger.warning("Config file from environment variable does not exist: %s", env_config)
     
-    # Check current directory
-    current_dir_config = Path.cwd() / "mldp-config.yaml"
-    logger.debug("Checking for config file in current directory: %s", current_dir_config)
-    if current_dir_config.exists():
-        logger.info("Found config file in current directory: %s", current_dir_config)
-        return str(current_dir_config)
+    # Check current directory.  The searches below use os.path string operations rather than pathlib, whose
+    # per-call object construction costs more than the stat() calls themselves.
+    current_path = os.getcwd()
+    for file_name in CONFIG_FILE_NAMES:
+        current_dir_config = os.path.join(current_path, file_name)
+        _logger.debug("Checking for config file in current directory: %s", current_dir_config)
+        if os.path.exists(current_dir_config):
+            _logger.info("Found config file in current directory: %s", current_dir_config)
+            return current_dir_config
     
     # Check project root (look for pyproject.toml to identify project root)
-    current_path = Path.cwd()
-    logger.debug("Searching for config file in project root directories")
-    for parent in [current_path] + list(current_path.parents):
-        if (parent / "pyproject.toml").exists():
-            project_config = parent / "mldp-config.yaml"
-            logger.debug("Checking project root config: %s", project_config)
-            if project_config.exists():
-                logger.info("Found config file in project root: %s", project_config)
-                return str(project_config)
+    _logger.debug("Searching for config file in project root directories")
+    for parent in _iter_parents(current_path):
+        if os.path.exists(os.path.join(parent, "pyproject.toml")):
+            for file_name in CONFIG_FILE_NAMES:
+                project_config = os.path.join(parent, file_name)
+                _logger.debug("Checking project root config: %s", project_config)
+                if os.path.exists(project_config):
+                    _logger.info("Found config file in project root: %s", project_config)
+                    return project_config
     
     # No config file found
-    logger.debug("No configuration file found in any searched location")
+    _logger.debug("No configuration file found in any searched location")
     return None
 
 
+def _iter_parents(path: str) -> Iterator[str]:
+    """Yields path and then each of its parent directories, up to the filesystem root."""
+    while True:
+        yield path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return
+        path = parent
+
+
 def load_config(config_file: Optional[str] = None, 
                 config_object: Optional[MldpConfig] = None) -> MldpConfig:
     """
     Load MLDP configuration with priority handling:
     1. Explicit config_object parameter (highest priority)
-    2. Environment variables (override YAML values)
-    3. YAML configuration file
+    2. Environment variables (override configuration file values)
+    3. YAML or JSON configuration file
     4. Default values (lowest priority)
     
     Args:
-        config_file: Optional path to YAML configuration file
+        config_file: Optional path to YAML or JSON configuration file
         config_object: Optional pre-constructed config object
         
     Returns:
@@ -76,39 +94,70 @@ def load_config(config_file: Optional[str] = None,
     Raises:
         ValueError: If configuration loading fails
     """
-    logger = logging.getLogger(__name__)
-    logger.debug("Loading MLDP configuration with config_file=%s, config_object=%s", 
+    _logger.debug("Loading MLDP configuration with config_file=%s, config_object=%s", 
                 config_file, config_object is not None)
     
-    # If explicit config object provided, use it (but still allow env var overrides)
+    # If explicit config object provided, use a copy of it.  Every field is taken from config_object, which was
+    # validated when it was built, so the copy skips re-validation and the environment variable scan.
     if config_object:
-        logger.info("Using explicit config object with environment variable overrides")
-        # Create a new instance that will pick up environment variables
-        return MldpConfig(
-            ingestion_host=config_object.ingestion.host,
-            ingestion_port=config_object.ingestion.port,
-            ingestion_use_tls=config_object.ingestion.use_tls,
-            query_host=config_object.query.host,
-            query_port=config_object.query.port,
-            query_use_tls=config_object.query.use_tls,
-            annotation_host=config_object.annotation.host,
-            annotation_port=config_object.annotation.port,
-            annotation_use_tls=config_object.annotation.use_tls
-        )
+        _logger.info("Using explicit config object")
+        return config_object.model_copy(deep=True)
     
-    # Find and load from YAML file (if available)
+    # Find and load from configuration file (if available)
     yaml_file = find_config_file(config_file)
     
     if yaml_file:
-        logger.info("Loading configuration from YAML file: %s", yaml_file)
+        _logger.info("Loading configuration from file: %s", yaml_file)
+    else:
+        _logger.info("No configuration file found, using default configuration with environment variable overrides")
+    
+    # Repeat loads of an unchanged file with unchanged MLDP_* environment variables reuse the parsed config.  Each
+    # caller gets its own copy, so changes made to the returned config don't leak into later loads.
+    config = _load_config_cached(yaml_file, _file_fingerprint(yaml_file), _env_fingerprint())
+    return config.model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(yaml_file: Optional[str],
+                        file_fingerprint: Optional[Tuple[int, int, int]],
+                        env_fingerprint: Tuple[Tuple[str, str], ...]) -> MldpConfig:
+    """
+    Build MldpConfig from the YAML file (if any) and environment variables.  The fingerprint arguments are not used
+    directly; they are part of the cache key, so that the config is rebuilt when the file or environment changes.
+    """
+    if yaml_file:
         # Load from YAML, with environment variable overrides
         return MldpConfig.from_yaml(yaml_file)
-    else:
-        logger.info("No YAML file found, using default configuration with environment variable overrides")
-        # No YAML file, use defaults with environment variable overrides
-        return MldpConfig()
+    # No YAML file, use defaults with environment variable overrides
+    return MldpConfig()
+
+
+def _file_fingerprint(path: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    """
+    Returns the inode, modification time and size of the file, or None if there is no such file.  Including the inode
+    catches files replaced by a rename (as editors and deployment tools do), but a same-size rewrite in place within
+    the filesystem's timestamp granularity is not detected; call clear_config_cache() after such a change.
+    """
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _env_fingerprint() -> Tuple[Tuple[str, str], ...]:
+    """Returns the MLDP_* environment variables, which MldpConfig reads case-insensitively."""
+    return tuple(sorted((name.upper(), value) for name, value in os.environ.items() if name.upper().startswith('MLDP_')))
+
+
+def clear_config_cache() -> None:
+    """Discard the configurations cached by load_config() and get_default_config() (useful for testing)."""
+    _load_config_cached.cache_clear()
 
 
 def get_default_config() -> MldpConfig:
     """Get default configuration (useful for testing)."""
-    return MldpConfig()
\ No newline at end of file
+    # Shares load_config()'s cache of the default (no YAML file) configuration
+    return _load_config_cached(None, None, _env_fingerprint()).model_copy(deep=True)
\ No newline at end of file
@@ -2,11 +2,6 @@ import unittest
 import time
 import logging
 import grpc
-import sys
-import os
-
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
 from dp_python_lib.client.mldp_client import MldpClient
 from dp_python_lib.client.ingestion_client import RegisterProviderRequestParams
@@ -0,0 +1,145 @@
+import unittest
+from unittest.mock import Mock, AsyncMock, patch
+import grpc
+
+from dp_python_lib.client.async_ingestion_client import AsyncIngestionClient
+from dp_python_lib.client.ingestion_client import IngestionClient, RegisterProviderRequestParams, RegisterProviderApiResult
+from dp_python_lib.client.service_api_client_base import ChannelPool
+from dp_python_lib.grpc import ingestion_pb2
+
+
+class TestAsyncIngestionClient(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.mock_channel = Mock()
+        self.client = AsyncIngestionClient(self.mock_channel)
+
+    def test_not_a_blocking_ingestion_client(self):
+        """Test AsyncIngestionClient is not substitutable for IngestionClient, whose methods are not coroutines."""
+        self.assertNotIsInstance(self.client, IngestionClient)
+
+    async def test_channel_pool_aclose(self):
+        """Test ChannelPool.aclose() awaits the close() coroutine of each grpc.aio channel."""
+        channels = [Mock(close=AsyncMock()), Mock(close=AsyncMock())]
+        pool = ChannelPool(channels)
+
+        await pool.aclose()
+
+        for channel in channels:
+            channel.close.assert_awaited_once_with()
+
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    async def test_send_register_provider_success(self, mock_stub_class):
+        """Test _send_register_provider awaits the RPC and wraps a successful response."""
+        mock_response = Mock()
+        mock_response.HasField = Mock()
+        mock_response.HasField.side_effect = lambda field: field == 'registrationResult'
+
+        mock_stub = Mock()
+        mock_stub.registerProvider = AsyncMock(return_value=mock_response)
+        mock_stub_class.return_value = mock_stub
+        client = AsyncIngestionClient(self.mock_channel)
+
+        request = ingestion_pb2.RegisterProviderRequest()
+        request.providerName = "test_provider"
+
+        result = await client._send_register_provider(request)
+
+        self.assertIsInstance(result, RegisterProviderApiResult)
+        self.assertFalse(result.result_status.is_error)
+        self.assertEqual(result.response, mock_response)
+        mock_stub_class.assert_called_once_with(self.mock_channel)
+        mock_stub.registerProvider.assert_awaited_once_with(request)
+
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    async def test_send_register_provider_grpc_error(self, mock_stub_class):
+        """Test _send_register_provider with gRPC RpcError."""
+        mock_grpc_error = grpc.RpcError()
+        mock_grpc_error.details = Mock(return_value="Connection timeout")
+
+        mock_stub = Mock()
+        mock_stub.registerProvider = AsyncMock(side_effect=mock_grpc_error)
+        mock_stub_class.return_value = mock_stub
+        client = AsyncIngestionClient(self.mock_channel)
+
+        request = ingestion_pb2.RegisterProviderRequest()
+        request.providerName = "test_provider"
+
+        result = await client._send_register_provider(request)
+
+        self.assertTrue(result.result_status.is_error)
+        self.assertIn("gRPC error: Connection timeout", result.result_status.message)
+        self.assertIsNone(result.response)
+
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    async def test_register_provider_exceptional_result(self, mock_stub_class):
+        """Test register_provider with exceptionalResult (business error)."""
+        mock_response = Mock()
+        mock_response.HasField = Mock()
+        mock_response.HasField.side_effect = lambda field: field == 'exceptionalResult'
+        mock_response.exceptionalResult.message = "Provider name already exists"
+
+        mock_stub = Mock()
+        mock_stub.registerProvider = AsyncMock(return_value=mock_response)
+        mock_stub_class.return_value = mock_stub
+        client = AsyncIngestionClient(self.mock_channel)
+
+        params = RegisterProviderRequestParams(name="duplicate_provider", description=None, tag_list=None, attribute_map=None)
+
+        result = await client.register_provider(params)
+
+        self.assertTrue(result.result_status.is_error)
+        self.assertEqual(result.result_status.message, "Provider name already exists")
+
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    async def test_register_providers_preserves_order(self, mock_stub_class):
+        """Test register_providers awaits all calls and returns results in input order."""
+        def make_response(request):
+            response = Mock()
+            response.HasField = Mock(side_effect=lambda field: field == 'registrationResult')
+            response.providerName = request.providerName
+            return response
+
+        mock_stub = Mock()
+        mock_stub.registerProvider = AsyncMock(side_effect=make_response)
+        mock_stub_class.return_value = mock_stub
+        client = AsyncIngestionClient(self.mock_channel)
+
+        params_list = [
+            RegisterProviderRequestParams(name=f"provider_{i}", description=None, tag_list=None, attribute_map=None)
+            for i in range(5)
+        ]
+
+        results = await client.register_providers(params_list, batch_size=2)
+
+        self.assertEqual([result.response.providerName for result in results], [f"provider_{i}" for i in range(5)])
+        self.assertEqual(mock_stub.registerProvider.await_count, 5)
+
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    async def test_register_provider_cache_registrations(self, mock_stub_class):
+        """Test repeated registration with identical params is served from the cache when enabled."""
+        mock_response = Mock()
+        mock_response.HasField = Mock(side_effect=lambda field: field == 'registrationResult')
+
+        mock_stub = Mock()
+        mock_stub.registerProvider = AsyncMock(return_value=mock_response)
+        mock_stub_class.return_value = mock_stub
+        client = AsyncIngestionClient(self.mock_channel, cache_registrations=True)
+
+        params = RegisterProviderRequestParams(name="test_provider", description=None, tag_list=None, attribute_map=None)
+
+        first = await client.register_provider(params)
+        results = await client.register_providers([params, params])
+
+        self.assertEqual(results, [first, first])
+        mock_stub.registerProvider.assert_awaited_once()
+
+    async def test_register_providers_invalid_batch_size(self):
+        """Test register_providers rejects a non-positive batch_size."""
+        with self.assertRaises(ValueError):
+            await self.client.register_providers([], batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
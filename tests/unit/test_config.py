@@ -3,12 +3,12 @@ from unittest.mock import patch, mock_open
 import tempfile
 import os
 import sys
+import subprocess
 from pathlib import Path
+from pydantic import ValidationError
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
-
-from dp_python_lib.config import ServiceConfig, MldpConfig, load_config
+from dp_python_lib.config import ServiceConfig, MldpConfig, load_config, clear_config_cache
+from dp_python_lib.config.config import DEFAULT_CHANNEL_OPTIONS
 from dp_python_lib.config.loader import find_config_file, get_default_config
 import grpc
 
@@ -46,7 +46,7 @@ class TestServiceConfig(unittest.TestCase):
         
         channel = config.create_channel()
         
-        mock_insecure_channel.assert_called_once_with("localhost:50051")
+        mock_insecure_channel.assert_called_once_with("localhost:50051", options=list(DEFAULT_CHANNEL_OPTIONS.items()))
         self.assertEqual(channel, mock_channel)
     
     @patch('grpc.ssl_channel_credentials')
@@ -62,8 +62,53 @@ class TestServiceConfig(unittest.TestCase):
         channel = config.create_channel()
         
         mock_ssl_creds.assert_called_once()
-        mock_secure_channel.assert_called_once_with("secure.example.com:443", mock_creds)
+        mock_secure_channel.assert_called_once_with("secure.example.com:443", mock_creds, options=list(DEFAULT_CHANNEL_OPTIONS.items()))
+        self.assertEqual(channel, mock_channel)
+    
+    @patch('grpc.aio.insecure_channel')
+    def test_create_aio_channel_insecure(self, mock_aio_insecure_channel):
+        """Test creating insecure grpc.aio channel."""
+        config = ServiceConfig(host="localhost", port=50051, use_tls=False)
+        mock_channel = unittest.mock.Mock()
+        mock_aio_insecure_channel.return_value = mock_channel
+        
+        channel = config.create_aio_channel()
+        
+        mock_aio_insecure_channel.assert_called_once_with("localhost:50051", options=list(DEFAULT_CHANNEL_OPTIONS.items()))
         self.assertEqual(channel, mock_channel)
+    
+    @patch('grpc.insecure_channel')
+    def test_create_channel_pool(self, mock_insecure_channel):
+        """Test creating a pool of gRPC channels, each with its own subchannel pool."""
+        config = ServiceConfig(host="localhost", port=50051, channel_pool_size=3)
+        mock_channels = [unittest.mock.Mock() for _ in range(3)]
+        mock_insecure_channel.side_effect = mock_channels
+        
+        pool = config.create_channel_pool()
+        
+        self.assertEqual(len(pool), 3)
+        self.assertEqual(mock_insecure_channel.call_count, 3)
+        options = mock_insecure_channel.call_args.kwargs['options']
+        self.assertIn(("grpc.use_local_subchannel_pool", 1), options)
+        # Channels are handed out round-robin
+        self.assertEqual([pool.get() for _ in range(4)], mock_channels + mock_channels[:1])
+    
+    def test_build_channel_options_overrides(self):
+        """Test that service channel_options and call options override the defaults."""
+        config = ServiceConfig(channel_options={"grpc.keepalive_time_ms": 600000, "grpc.default_compression_algorithm": 2})
+        
+        options = dict(config.build_channel_options([("grpc.max_send_message_length", 1024)]))
+        
+        self.assertEqual(options["grpc.keepalive_time_ms"], 600000)
+        self.assertEqual(options["grpc.default_compression_algorithm"], 2)
+        self.assertEqual(options["grpc.max_send_message_length"], 1024)
+        self.assertEqual(options["grpc.max_receive_message_length"],
+                         DEFAULT_CHANNEL_OPTIONS["grpc.max_receive_message_length"])
+    
+    def test_channel_pool_size_must_be_positive(self):
+        """Test that channel_pool_size is validated."""
+        with self.assertRaises(ValueError):
+            ServiceConfig(channel_pool_size=0)
 
 
 class TestMldpConfig(unittest.TestCase):
@@ -78,6 +123,49 @@ class TestMldpConfig(unittest.TestCase):
         self.assertEqual(config.annotation.port, 50053)
         self.assertFalse(config.ingestion.use_tls)
     
+    def test_service_config_properties_cached(self):
+        """Test that service configs are built once and rebuilt after a field changes."""
+        config = MldpConfig()
+        
+        self.assertIs(config.ingestion, config.ingestion)
+        query = config.query
+        
+        config.ingestion_host = "changed-host"
+        
+        self.assertEqual(config.ingestion.host, "changed-host")
+        # Unrelated services keep their cached config
+        self.assertIs(config.query, query)
+    
+    def test_service_config_properties_read_only(self):
+        """Test that service configs cannot be changed apart from the flat fields they are built from."""
+        config = MldpConfig()
+        
+        with self.assertRaises(ValidationError):
+            config.ingestion.port = 1
+        
+        config.ingestion_port = 1
+        
+        self.assertEqual(config.ingestion.port, 1)
+        self.assertEqual(config.model_dump()['ingestion_port'], 1)
+        
+        with self.assertRaises(TypeError):
+            config.ingestion.channel_options['x'] = 1
+    
+    def test_service_config_properties_follow_copies_and_in_place_changes(self):
+        """Test that service configs are rebuilt when fields change without going through attribute assignment."""
+        config = MldpConfig()
+        self.assertEqual(config.ingestion.port, 50051)
+        
+        copied = config.model_copy(update={'ingestion_port': 9})
+        
+        self.assertEqual(copied.ingestion.port, 9)
+        self.assertEqual(config.ingestion.port, 50051)
+        
+        config.ingestion_channel_options['grpc.keepalive_time_ms'] = 600000
+        
+        self.assertEqual(dict(config.ingestion.channel_options), {'grpc.keepalive_time_ms': 600000})
+        self.assertIn(('grpc.keepalive_time_ms', 600000), config.ingestion.build_channel_options())
+    
     @patch.dict(os.environ, {
         'MLDP_INGESTION_HOST': 'prod-ingestion.example.com',
         'MLDP_INGESTION_PORT': '443', 
@@ -120,6 +208,9 @@ query:
 annotation:
   host: yaml-annotation.example.com
   port: 9003
+  channel_pool_size: 4
+  channel_options:
+    grpc.keepalive_time_ms: 600000
 """
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
             f.write(yaml_content)
@@ -134,6 +225,34 @@ annotation:
                 self.assertEqual(config.query.host, 'yaml-query.example.com')
                 self.assertEqual(config.query.port, 9002)
                 self.assertEqual(config.annotation.host, 'yaml-annotation.example.com')
+                self.assertEqual(config.annotation.channel_pool_size, 4)
+                self.assertEqual(config.ingestion.channel_pool_size, 1)
+                self.assertEqual(dict(config.annotation.channel_options), {"grpc.keepalive_time_ms": 600000})
+                
+            finally:
+                os.unlink(f.name)
+    
+    def test_from_yaml_json_file(self):
+        """Test loading config from a JSON file with the same structure as the YAML file."""
+        json_content = """
+{
+  "ingestion": {"host": "json-ingestion.example.com", "port": 9001, "use_tls": true},
+  "annotation": {"channel_pool_size": 2, "channel_options": {"grpc.keepalive_time_ms": 600000}}
+}
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write(json_content)
+            f.flush()
+            
+            try:
+                config = MldpConfig.from_yaml(f.name)
+                
+                self.assertEqual(config.ingestion.host, 'json-ingestion.example.com')
+                self.assertEqual(config.ingestion.port, 9001)
+                self.assertTrue(config.ingestion.use_tls)
+                self.assertEqual(config.query.host, 'localhost')
+                self.assertEqual(config.annotation.channel_pool_size, 2)
+                self.assertEqual(dict(config.annotation.channel_options), {"grpc.keepalive_time_ms": 600000})
                 
             finally:
                 os.unlink(f.name)
@@ -183,6 +302,10 @@ annotation:
 
 class TestConfigLoader(unittest.TestCase):
     
+    def setUp(self):
+        """Discard configurations cached by earlier load_config() calls."""
+        clear_config_cache()
+    
     def test_find_config_file_explicit(self):
         """Test finding config file when explicitly provided."""
         with tempfile.NamedTemporaryFile(suffix='.yaml', delete=False) as f:
@@ -222,6 +345,39 @@ class TestConfigLoader(unittest.TestCase):
         # Should return None when no config file found
         self.assertIsNone(result)
     
+    def test_find_config_file_project_root(self):
+        """Test finding config file in a parent directory containing pyproject.toml."""
+        with tempfile.TemporaryDirectory() as project_root:
+            Path(project_root, 'pyproject.toml').touch()
+            Path(project_root, 'mldp-config.yaml').touch()
+            subdir = Path(project_root, 'src', 'pkg')
+            subdir.mkdir(parents=True)
+            
+            original_cwd = os.getcwd()
+            os.chdir(subdir)
+            try:
+                with patch.dict(os.environ, {}, clear=True):
+                    result = find_config_file()
+            finally:
+                os.chdir(original_cwd)
+            
+            self.assertEqual(os.path.realpath(result), os.path.realpath(os.path.join(project_root, 'mldp-config.yaml')))
+    
+    def test_find_config_file_json(self):
+        """Test finding mldp-config.json in the current directory when there is no mldp-config.yaml."""
+        with tempfile.TemporaryDirectory() as config_dir:
+            Path(config_dir, 'mldp-config.json').touch()
+            
+            original_cwd = os.getcwd()
+            os.chdir(config_dir)
+            try:
+                with patch.dict(os.environ, {}, clear=True):
+                    result = find_config_file()
+            finally:
+                os.chdir(original_cwd)
+            
+            self.assertEqual(os.path.basename(result), 'mldp-config.json')
+    
     def test_load_config_with_explicit_object(self):
         """Test loading config with explicit config object."""
         custom_config = MldpConfig(ingestion_host="custom-host")
@@ -230,6 +386,18 @@ class TestConfigLoader(unittest.TestCase):
         
         self.assertEqual(result.ingestion.host, "custom-host")
     
+    def test_load_config_with_explicit_object_copies(self):
+        """Test the explicit config object is copied field for field, including options."""
+        custom_config = MldpConfig(query_port=6000, annotation_channel_pool_size=2,
+                                   ingestion_channel_options={"grpc.keepalive_time_ms": 600000})
+        
+        result = load_config(config_object=custom_config)
+        
+        self.assertIsNot(result, custom_config)
+        self.assertEqual(result.model_dump(), custom_config.model_dump())
+        result.ingestion_channel_options["grpc.keepalive_time_ms"] = 1
+        self.assertEqual(dict(custom_config.ingestion.channel_options), {"grpc.keepalive_time_ms": 600000})
+    
     @patch('dp_python_lib.config.loader.find_config_file')
     @patch('dp_python_lib.config.config.MldpConfig.from_yaml')
     def test_load_config_from_yaml(self, mock_from_yaml, mock_find_config):
@@ -255,6 +423,71 @@ class TestConfigLoader(unittest.TestCase):
         self.assertIsInstance(result, MldpConfig)
         self.assertEqual(result.ingestion.host, 'localhost')
     
+    def test_load_config_cached(self):
+        """Test repeat loads reuse the parsed YAML until the file or environment changes."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write("ingestion:\n  host: cached-host.example.com\n")
+        
+        try:
+            with patch('dp_python_lib.config.config.MldpConfig.from_yaml', wraps=MldpConfig.from_yaml) as mock_from_yaml:
+                first = load_config(config_file=f.name)
+                second = load_config(config_file=f.name)
+                
+                mock_from_yaml.assert_called_once_with(f.name)
+                self.assertEqual(second.ingestion.host, 'cached-host.example.com')
+                # Each call returns its own copy
+                self.assertIsNot(first, second)
+                first.ingestion_host = 'changed-host.example.com'
+                self.assertEqual(load_config(config_file=f.name).ingestion.host, 'cached-host.example.com')
+                
+                with patch.dict(os.environ, {'MLDP_QUERY_HOST': 'env-host.example.com'}):
+                    self.assertEqual(load_config(config_file=f.name).query.host, 'env-host.example.com')
+                self.assertEqual(mock_from_yaml.call_count, 2)
+        finally:
+            os.unlink(f.name)
+    
+    def test_load_config_cache_detects_replaced_file(self):
+        """Test a file replaced with same-size content and the same modification time is reloaded."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write("ingestion:\n  host: first-host.example.com\n")
+        
+        try:
+            self.assertEqual(load_config(config_file=f.name).ingestion.host, 'first-host.example.com')
+            
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', dir=os.path.dirname(f.name), delete=False) as g:
+                g.write("ingestion:\n  host: other-host.example.com\n")
+            stat = os.stat(f.name)
+            os.utime(g.name, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            os.replace(g.name, f.name)
+            
+            self.assertEqual(load_config(config_file=f.name).ingestion.host, 'other-host.example.com')
+        finally:
+            os.unlink(f.name)
+    
+    def test_clear_config_cache(self):
+        """Test clear_config_cache() makes the next load re-read the configuration file."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write("ingestion:\n  host: cached-host.example.com\n")
+        
+        try:
+            with patch('dp_python_lib.config.config.MldpConfig.from_yaml', wraps=MldpConfig.from_yaml) as mock_from_yaml:
+                load_config(config_file=f.name)
+                clear_config_cache()
+                load_config(config_file=f.name)
+                
+                self.assertEqual(mock_from_yaml.call_count, 2)
+        finally:
+            os.unlink(f.name)
+    
+    def test_load_config_does_not_import_grpc(self):
+        """Test that loading configuration defers the grpc import until a channel is created."""
+        src_dir = os.path.join(os.path.dirname(__file__), '../../src')
+        code = ("import sys; from dp_python_lib.config import load_config; "
+                "load_config().ingestion.connection_string(); print('grpc' in sys.modules)")
+        output = subprocess.run([sys.executable, '-c', code], cwd=src_dir, capture_output=True, text=True, check=True)
+        
+        self.assertEqual(output.stdout.strip(), "False")
+    
     def test_get_default_config(self):
         """Test getting default configuration."""
         config = get_default_config()
@@ -262,6 +495,16 @@ class TestConfigLoader(unittest.TestCase):
         self.assertIsInstance(config, MldpConfig)
         self.assertEqual(config.ingestion.host, 'localhost')
         self.assertEqual(config.ingestion.port, 50051)
+    
+    def test_get_default_config_environment_override(self):
+        """Test the default configuration reflects MLDP_* environment variables set after earlier calls."""
+        get_default_config()
+        
+        with patch.dict(os.environ, {'MLDP_INGESTION_PORT': '6000'}):
+            config = get_default_config()
+        
+        self.assertEqual(config.ingestion.port, 6000)
+        self.assertEqual(get_default_config().ingestion.port, 50051)
 
 
 if __name__ == '__main__':
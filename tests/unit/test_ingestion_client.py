@@ -1,13 +1,10 @@
 import unittest
 from unittest.mock import Mock, patch, MagicMock
-import sys
-import os
+from concurrent.futures import ThreadPoolExecutor
 import grpc
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
-
-from dp_python_lib.client.ingestion_client import IngestionClient, RegisterProviderRequestParams, RegisterProviderApiResult
+from dp_python_lib.client.ingestion_client import IngestionClient, RegisterProviderRequestParams, BatchRegisterProviderRequestParams, RegisterProviderApiResult
+from dp_python_lib.client.service_api_client_base import ChannelPool
 from dp_python_lib.grpc import ingestion_pb2
 from dp_python_lib.grpc import common_pb2
 
@@ -157,6 +154,44 @@ class TestIngestionClient(unittest.TestCase):
         for attr in request.attributes:
             self.assertIsInstance(attr, common_pb2.Attribute)
 
+    def test_build_register_provider_request_returns_distinct_messages(self):
+        """Test each build returns a new message, since batched requests are in flight concurrently."""
+        first = self.client._build_register_provider_request(
+            RegisterProviderRequestParams(name="first", description=None, tag_list=["a"], attribute_map={"k": "v"}))
+        second = self.client._build_register_provider_request(
+            RegisterProviderRequestParams(name="second", description=None, tag_list=None, attribute_map=None))
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first.providerName, "first")
+        self.assertEqual(list(first.tags), ["a"])
+        self.assertEqual(len(first.attributes), 1)
+
+    def test_build_register_provider_request_shared_attributes(self):
+        """Test attributes merged from cached encodings match attributes set field by field."""
+        attribute_map = {"env": "prod", "region": "us-east", "empty": ""}
+        first = self.client._build_register_provider_request(
+            RegisterProviderRequestParams(name="first", description=None, tag_list=None, attribute_map=attribute_map))
+        second = self.client._build_register_provider_request(
+            RegisterProviderRequestParams(name="second", description=None, tag_list=None, attribute_map=attribute_map))
+
+        expected = ingestion_pb2.RegisterProviderRequest(providerName="second")
+        for name, value in attribute_map.items():
+            expected.attributes.add(name=name, value=value)
+
+        self.assertEqual(second, expected)
+        self.assertEqual(list(first.attributes), list(second.attributes))
+        first.attributes[0].value = "dev"
+        self.assertEqual(second.attributes[0].value, "prod")
+
+    def test_params_and_result_use_slots(self):
+        """Test that per-call params and result objects do not allocate an instance __dict__."""
+        params = RegisterProviderRequestParams(name="test_provider", description=None, tag_list=None, attribute_map=None)
+        result = RegisterProviderApiResult(is_error=False, message="")
+
+        self.assertFalse(hasattr(params, '__dict__'))
+        self.assertFalse(hasattr(result, '__dict__'))
+        self.assertFalse(hasattr(result.result_status, '__dict__'))
+
     @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
     def test_send_register_provider_success(self, mock_stub_class):
         """Test _send_register_provider with successful response."""
@@ -169,13 +204,14 @@ class TestIngestionClient(unittest.TestCase):
         mock_stub = Mock()
         mock_stub.registerProvider.return_value = mock_response
         mock_stub_class.return_value = mock_stub
+        client = IngestionClient(self.mock_channel)
         
         # Create test request
         request = ingestion_pb2.RegisterProviderRequest()
         request.providerName = "test_provider"
         
         # Call method
-        result = self.client._send_register_provider(request)
+        result = client._send_register_provider(request)
         
         # Verify results
         self.assertIsInstance(result, RegisterProviderApiResult)
@@ -200,13 +236,14 @@ class TestIngestionClient(unittest.TestCase):
         mock_stub = Mock()
         mock_stub.registerProvider.return_value = mock_response
         mock_stub_class.return_value = mock_stub
+        client = IngestionClient(self.mock_channel)
         
         # Create test request
         request = ingestion_pb2.RegisterProviderRequest()
         request.providerName = "duplicate_provider"
         
         # Call method
-        result = self.client._send_register_provider(request)
+        result = client._send_register_provider(request)
         
         # Verify results
         self.assertIsInstance(result, RegisterProviderApiResult)
@@ -225,13 +262,14 @@ class TestIngestionClient(unittest.TestCase):
         mock_stub = Mock()
         mock_stub.registerProvider.return_value = mock_response
         mock_stub_class.return_value = mock_stub
+        client = IngestionClient(self.mock_channel)
         
         # Create test request
         request = ingestion_pb2.RegisterProviderRequest()
         request.providerName = "test_provider"
         
         # Call method
-        result = self.client._send_register_provider(request)
+        result = client._send_register_provider(request)
         
         # Verify results
         self.assertIsInstance(result, RegisterProviderApiResult)
@@ -248,13 +286,14 @@ class TestIngestionClient(unittest.TestCase):
         mock_grpc_error.details = Mock(return_value="Connection timeout")
         mock_stub.registerProvider.side_effect = mock_grpc_error
         mock_stub_class.return_value = mock_stub
+        client = IngestionClient(self.mock_channel)
         
         # Create test request
         request = ingestion_pb2.RegisterProviderRequest()
         request.providerName = "test_provider"
         
         # Call method
-        result = self.client._send_register_provider(request)
+        result = client._send_register_provider(request)
         
         # Verify results
         self.assertIsInstance(result, RegisterProviderApiResult)
@@ -269,13 +308,14 @@ class TestIngestionClient(unittest.TestCase):
         mock_stub = Mock()
         mock_stub.registerProvider.side_effect = ValueError("Invalid parameter")
         mock_stub_class.return_value = mock_stub
+        client = IngestionClient(self.mock_channel)
         
         # Create test request
         request = ingestion_pb2.RegisterProviderRequest()
         request.providerName = "test_provider"
         
         # Call method
-        result = self.client._send_register_provider(request)
+        result = client._send_register_provider(request)
         
         # Verify results
         self.assertIsInstance(result, RegisterProviderApiResult)
@@ -283,6 +323,292 @@ class TestIngestionClient(unittest.TestCase):
         self.assertIn("Unexpected error: Invalid parameter", result.result_status.message)
         self.assertIsNone(result.response)
 
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    def test_register_providers_batches_requests(self, mock_stub_class):
+        """Test register_providers issues pipelined calls in batches and preserves order."""
+        mock_response = Mock()
+        mock_response.HasField = Mock()
+        mock_response.HasField.side_effect = lambda field: field == 'registrationResult'
+
+        mock_stub = Mock()
+        mock_stub.registerProvider.future.side_effect = lambda request: Mock(result=Mock(return_value=mock_response))
+        mock_stub_class.return_value = mock_stub
+        client = IngestionClient(self.mock_channel)
+
+        params_list = [
+            RegisterProviderRequestParams(name=f"provider_{i}", description=None, tag_list=None, attribute_map=None)
+            for i in range(5)
+        ]
+
+        results = client.register_providers(params_list, batch_size=2)
+
+        self.assertEqual(len(results), 5)
+        for result in results:
+            self.assertFalse(result.result_status.is_error)
+            self.assertEqual(result.response, mock_response)
+
+        # Stub built once and reused across batches, one future per provider, in input order
+        mock_stub_class.assert_called_once_with(self.mock_channel)
+        sent_names = [call.args[0].providerName for call in mock_stub.registerProvider.future.call_args_list]
+        self.assertEqual(sent_names, [f"provider_{i}" for i in range(5)])
+        mock_stub.registerProvider.assert_not_called()
+
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    def test_register_providers_partial_failure(self, mock_stub_class):
+        """Test register_providers reports per-provider errors without failing the whole batch."""
+        mock_response = Mock()
+        mock_response.HasField = Mock()
+        mock_response.HasField.side_effect = lambda field: field == 'registrationResult'
+
+        mock_grpc_error = grpc.RpcError()
+        mock_grpc_error.details = Mock(return_value="Connection timeout")
+
+        ok_future = Mock()
+        ok_future.result.return_value = mock_response
+        failed_future = Mock()
+        failed_future.result.side_effect = mock_grpc_error
+
+        mock_stub = Mock()
+        mock_stub.registerProvider.future.side_effect = [ok_future, failed_future]
+        mock_stub_class.return_value = mock_stub
+        client = IngestionClient(self.mock_channel)
+
+        params_list = [
+            RegisterProviderRequestParams(name="ok_provider", description=None, tag_list=None, attribute_map=None),
+            RegisterProviderRequestParams(name="failed_provider", description=None, tag_list=None, attribute_map=None),
+        ]
+
+        results = client.register_providers(params_list)
+
+        self.assertFalse(results[0].result_status.is_error)
+        self.assertEqual(results[0].response, mock_response)
+        self.assertTrue(results[1].result_status.is_error)
+        self.assertIn("gRPC error: Connection timeout", results[1].result_status.message)
+        self.assertIsNone(results[1].response)
+
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    def test_register_providers_future_raises(self, mock_stub_class):
+        """Test register_providers reports a per-provider error when issuing a call fails synchronously."""
+        mock_response = Mock()
+        mock_response.HasField = Mock()
+        mock_response.HasField.side_effect = lambda field: field == 'registrationResult'
+
+        ok_future = Mock()
+        ok_future.result.return_value = mock_response
+
+        mock_grpc_error = grpc.RpcError()
+        mock_grpc_error.details = Mock(return_value="Channel unavailable")
+
+        mock_stub = Mock()
+        mock_stub.registerProvider.future.side_effect = [
+            ok_future, ValueError("Cannot invoke RPC: Channel closed!"), mock_grpc_error, ok_future]
+        mock_stub_class.return_value = mock_stub
+        client = IngestionClient(self.mock_channel)
+
+        params_list = [
+            RegisterProviderRequestParams(name=f"provider_{i}", description=None, tag_list=None, attribute_map=None)
+            for i in range(4)
+        ]
+
+        results = client.register_providers(params_list)
+
+        self.assertEqual(len(results), 4)
+        self.assertFalse(results[0].result_status.is_error)
+        self.assertTrue(results[1].result_status.is_error)
+        self.assertIn("Unexpected error: Cannot invoke RPC: Channel closed!", results[1].result_status.message)
+        self.assertTrue(results[2].result_status.is_error)
+        self.assertIn("gRPC error: Channel unavailable", results[2].result_status.message)
+        self.assertFalse(results[3].result_status.is_error)
+        # Calls issued before the failure are still resolved
+        self.assertEqual(ok_future.result.call_count, 2)
+
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    def test_send_register_provider_rotates_channel_pool(self, mock_stub_class):
+        """Test _send_register_provider spreads calls across the channels of a ChannelPool."""
+        channels = [Mock(), Mock()]
+        stubs = {channel: Mock() for channel in channels}
+        mock_stub_class.side_effect = lambda channel: stubs[channel]
+        client = IngestionClient(ChannelPool(channels))
+
+        request = ingestion_pb2.RegisterProviderRequest()
+        request.providerName = "test_provider"
+
+        client._send_register_provider(request)
+        client._send_register_provider(request)
+
+        # One stub is built per pooled channel, and each is used once
+        self.assertEqual(mock_stub_class.call_count, 2)
+        for stub in stubs.values():
+            stub.registerProvider.assert_called_once_with(request)
+
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    def test_send_register_providers_rotates_channel_pool(self, mock_stub_class):
+        """Test _send_register_providers spreads the calls of one batch across the channels of a ChannelPool."""
+        mock_response = Mock()
+        mock_response.HasField = Mock()
+        mock_response.HasField.side_effect = lambda field: field == 'registrationResult'
+
+        channels = [Mock(), Mock()]
+        stubs = {channel: Mock() for channel in channels}
+        for stub in stubs.values():
+            stub.registerProvider.future.side_effect = lambda request: Mock(result=Mock(return_value=mock_response))
+        mock_stub_class.side_effect = lambda channel: stubs[channel]
+        client = IngestionClient(ChannelPool(channels))
+
+        requests = [ingestion_pb2.RegisterProviderRequest(providerName=f"provider_{i}") for i in range(4)]
+
+        results = client._send_register_providers(requests)
+
+        self.assertFalse(any(result.result_status.is_error for result in results))
+        for stub in stubs.values():
+            self.assertEqual(stub.registerProvider.future.call_count, 2)
+
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    def test_register_providers_batch_params(self, mock_stub_class):
+        """Test register_providers builds requests from BatchRegisterProviderRequestParams parallel lists."""
+        mock_response = Mock()
+        mock_response.HasField = Mock()
+        mock_response.HasField.side_effect = lambda field: field == 'registrationResult'
+
+        mock_stub = Mock()
+        mock_stub.registerProvider.future.side_effect = lambda request: Mock(result=Mock(return_value=mock_response))
+        mock_stub_class.return_value = mock_stub
+        client = IngestionClient(self.mock_channel)
+
+        batch_params = BatchRegisterProviderRequestParams(
+            names=["provider_0", "provider_1", "provider_2"],
+            descriptions=["first", None, "third"],
+            attribute_maps=[None, {"location": "lab_a"}, None]
+        )
+
+        results = client.register_providers(batch_params, batch_size=2)
+
+        self.assertEqual(len(results), 3)
+        requests = [call.args[0] for call in mock_stub.registerProvider.future.call_args_list]
+        self.assertEqual([request.providerName for request in requests], ["provider_0", "provider_1", "provider_2"])
+        self.assertEqual([request.description for request in requests], ["first", "", "third"])
+        self.assertEqual(len(requests[0].tags), 0)
+        self.assertEqual(len(requests[0].attributes), 0)
+        self.assertEqual(len(requests[1].attributes), 1)
+        self.assertEqual(requests[1].attributes[0].name, "location")
+        self.assertEqual(requests[1].attributes[0].value, "lab_a")
+
+    def test_batch_params_length_mismatch(self):
+        """Test BatchRegisterProviderRequestParams rejects parallel lists of different lengths."""
+        with self.assertRaises(ValueError):
+            BatchRegisterProviderRequestParams(names=["provider_0", "provider_1"], descriptions=["only_one"])
+
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    def test_register_provider_cache_registrations(self, mock_stub_class):
+        """Test repeated registration with identical params is served from the cache when enabled."""
+        mock_response = Mock()
+        mock_response.HasField = Mock()
+        mock_response.HasField.side_effect = lambda field: field == 'registrationResult'
+
+        mock_stub = Mock()
+        mock_stub.registerProvider.return_value = mock_response
+        mock_stub.registerProvider.future.side_effect = lambda request: Mock(result=Mock(return_value=mock_response))
+        mock_stub_class.return_value = mock_stub
+        client = IngestionClient(self.mock_channel, cache_registrations=True)
+
+        params = RegisterProviderRequestParams(name="test_provider", description="desc", tag_list=["a"], attribute_map={"k": "v"})
+        other_params = RegisterProviderRequestParams(name="other_provider", description=None, tag_list=None, attribute_map=None)
+
+        first = client.register_provider(params)
+        second = client.register_provider(params)
+        batch_results = client.register_providers([params, other_params])
+
+        self.assertIs(second, first)
+        self.assertIs(batch_results[0], first)
+        mock_stub.registerProvider.assert_called_once()
+        # Only the provider that was not already registered is sent in the batch
+        sent_names = [call.args[0].providerName for call in mock_stub.registerProvider.future.call_args_list]
+        self.assertEqual(sent_names, ["other_provider"])
+
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    def test_register_provider_cache_skips_errors(self, mock_stub_class):
+        """Test failed registrations are not cached, and caching is off by default."""
+        mock_response = Mock()
+        mock_response.HasField = Mock()
+        mock_response.HasField.side_effect = lambda field: field == 'exceptionalResult'
+        mock_response.exceptionalResult.message = "Provider name already exists"
+
+        mock_stub = Mock()
+        mock_stub.registerProvider.return_value = mock_response
+        mock_stub_class.return_value = mock_stub
+        params = RegisterProviderRequestParams(name="test_provider", description=None, tag_list=None, attribute_map=None)
+
+        caching_client = IngestionClient(self.mock_channel, cache_registrations=True)
+        caching_client.register_provider(params)
+        caching_client.register_provider(params)
+        self.assertEqual(mock_stub.registerProvider.call_count, 2)
+
+        mock_response.HasField.side_effect = lambda field: field == 'registrationResult'
+        default_client = IngestionClient(self.mock_channel)
+        default_client.register_provider(params)
+        default_client.register_provider(params)
+        self.assertEqual(mock_stub.registerProvider.call_count, 4)
+
+    @patch('dp_python_lib.client.ingestion_client.REGISTRATION_CACHE_SIZE', 2)
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    def test_register_provider_cache_evicts_least_recently_used(self, mock_stub_class):
+        """Test the registration cache is bounded, evicting the least recently used result."""
+        mock_response = Mock()
+        mock_response.HasField = Mock()
+        mock_response.HasField.side_effect = lambda field: field == 'registrationResult'
+
+        mock_stub = Mock()
+        mock_stub.registerProvider.return_value = mock_response
+        mock_stub_class.return_value = mock_stub
+        client = IngestionClient(self.mock_channel, cache_registrations=True)
+
+        params = [
+            RegisterProviderRequestParams(name=f"provider_{i}", description=None, tag_list=None, attribute_map=None)
+            for i in range(3)
+        ]
+
+        client.register_provider(params[0])
+        client.register_provider(params[1])
+        client.register_provider(params[0])  # cache hit, making provider_1 the least recently used
+        client.register_provider(params[2])  # evicts provider_1
+        self.assertEqual(mock_stub.registerProvider.call_count, 3)
+        self.assertEqual(len(client._registration_cache), 2)
+
+        client.register_provider(params[0])
+        self.assertEqual(mock_stub.registerProvider.call_count, 3)
+        client.register_provider(params[1])
+        self.assertEqual(mock_stub.registerProvider.call_count, 4)
+
+    @patch('dp_python_lib.client.ingestion_client.REGISTRATION_CACHE_SIZE', 4)
+    @patch('dp_python_lib.client.ingestion_client.ingestion_pb2_grpc.DpIngestionServiceStub')
+    def test_register_provider_cache_concurrent(self, mock_stub_class):
+        """Test threads sharing a client can overfill the registration cache without errors."""
+        mock_response = Mock()
+        mock_response.HasField = Mock()
+        mock_response.HasField.side_effect = lambda field: field == 'registrationResult'
+
+        mock_stub = Mock()
+        mock_stub.registerProvider.return_value = mock_response
+        mock_stub_class.return_value = mock_stub
+        client = IngestionClient(self.mock_channel, cache_registrations=True)
+
+        params = [
+            RegisterProviderRequestParams(name=f"provider_{i % 8}", description=None, tag_list=None, attribute_map=None)
+            for i in range(2000)
+        ]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(client.register_provider, params))
+
+        self.assertEqual(len(results), len(params))
+        self.assertFalse(any(result.result_status.is_error for result in results))
+        self.assertLessEqual(len(client._registration_cache), 4)
+
+    def test_register_providers_invalid_batch_size(self):
+        """Test register_providers rejects a non-positive batch_size."""
+        with self.assertRaises(ValueError):
+            self.client.register_providers([], batch_size=0)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -2,13 +2,13 @@ import unittest
 from unittest.mock import Mock, patch
 import sys
 import os
+import subprocess
 import tempfile
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
-
 from dp_python_lib.client.mldp_client import MldpClient
+from dp_python_lib.client.service_api_client_base import ChannelPool
 from dp_python_lib.config import MldpConfig, ServiceConfig
+from dp_python_lib.config.config import DEFAULT_CHANNEL_OPTIONS
 
 
 class TestMldpClient(unittest.TestCase):
@@ -41,7 +41,7 @@ class TestMldpClient(unittest.TestCase):
         self.assertEqual(client._query_channel, query_channel)
         self.assertEqual(client._annotation_channel, annotation_channel)
     
-    @patch('dp_python_lib.client.mldp_client.load_config')
+    @patch('dp_python_lib.config.load_config')
     @patch('dp_python_lib.config.config.MldpConfig.create_ingestion_channel')
     @patch('dp_python_lib.config.config.MldpConfig.create_query_channel')
     @patch('dp_python_lib.config.config.MldpConfig.create_annotation_channel')
@@ -62,7 +62,7 @@ class TestMldpClient(unittest.TestCase):
         mock_annotation_channel.assert_called_once()
         self.assertEqual(client._config, mock_config)
     
-    @patch('dp_python_lib.client.mldp_client.load_config')
+    @patch('dp_python_lib.config.load_config')
     @patch('dp_python_lib.config.config.MldpConfig.create_ingestion_channel')
     def test_init_with_config_file(self, mock_ingestion_channel, mock_load_config):
         """Test MldpClient initialization with specific config file."""
@@ -94,7 +94,7 @@ class TestMldpClient(unittest.TestCase):
     
     def test_init_no_ingestion_channel_or_config(self):
         """Test MldpClient initialization fails without ingestion channel or config."""
-        with patch('dp_python_lib.client.mldp_client.load_config') as mock_load_config:
+        with patch('dp_python_lib.config.load_config') as mock_load_config:
             mock_load_config.return_value = None
             
             with self.assertRaises(ValueError) as context:
@@ -126,6 +126,50 @@ class TestMldpClient(unittest.TestCase):
         # Should not call create_ingestion_channel since explicit channel provided
         mock_ingestion_channel.assert_not_called()
     
+    @patch('dp_python_lib.config.config.MldpConfig.create_ingestion_channel_pool')
+    @patch('dp_python_lib.config.config.MldpConfig.create_ingestion_channel')
+    def test_init_with_channel_pool_config(self, mock_ingestion_channel, mock_ingestion_channel_pool):
+        """Test MldpClient creates an ingestion channel pool when configured with channel_pool_size > 1."""
+        config = MldpConfig(ingestion_channel_pool_size=4)
+        mock_pool = ChannelPool([self.mock_channel])
+        mock_ingestion_channel_pool.return_value = mock_pool
+        
+        client = MldpClient(config=config)
+        
+        mock_ingestion_channel_pool.assert_called_once()
+        mock_ingestion_channel.assert_not_called()
+        self.assertEqual(client._ingestion_channel, mock_pool)
+        self.assertEqual(client.ingestion_client._channel, self.mock_channel)
+    
+    @patch('dp_python_lib.config.config.MldpConfig.create_annotation_channel_pool')
+    @patch('dp_python_lib.config.config.MldpConfig.create_query_channel_pool')
+    @patch('dp_python_lib.config.config.MldpConfig.create_ingestion_channel')
+    def test_init_with_query_and_annotation_channel_pool_config(self, mock_ingestion_channel,
+                                                               mock_query_channel_pool,
+                                                               mock_annotation_channel_pool):
+        """Test MldpClient honours channel_pool_size > 1 for the query and annotation services."""
+        config = MldpConfig(query_channel_pool_size=4, annotation_channel_pool_size=2)
+        mock_query_pool = ChannelPool([Mock(), Mock()])
+        mock_annotation_pool = ChannelPool([Mock(), Mock()])
+        mock_query_channel_pool.return_value = mock_query_pool
+        mock_annotation_channel_pool.return_value = mock_annotation_pool
+        
+        client = MldpClient(config=config)
+        
+        mock_query_channel_pool.assert_called_once()
+        mock_annotation_channel_pool.assert_called_once()
+        self.assertIs(client._query_channel, mock_query_pool)
+        self.assertIs(client._annotation_channel, mock_annotation_pool)
+    
+    def test_import_does_not_load_config_dependencies(self):
+        """Test that importing MldpClient defers the pydantic-settings import until config is needed."""
+        src_dir = os.path.join(os.path.dirname(__file__), '../../src')
+        code = ("import sys; import dp_python_lib.client.mldp_client; "
+                "print('pydantic_settings' in sys.modules)")
+        output = subprocess.run([sys.executable, '-c', code], cwd=src_dir, capture_output=True, text=True, check=True)
+        
+        self.assertEqual(output.stdout.strip(), "False")
+    
     @patch('dp_python_lib.client.mldp_client.IngestionClient')
     def test_ingestion_client_creation(self, mock_ingestion_client_class):
         """Test that IngestionClient is properly created."""
@@ -141,9 +185,7 @@ class TestMldpClient(unittest.TestCase):
 class TestMldpClientConfigIntegration(unittest.TestCase):
     """Integration tests for MldpClient with real configuration."""
     
-    def test_config_from_yaml_file(self):
-        """Test loading MldpClient from YAML configuration."""
-        yaml_content = """
+    YAML_CONTENT = """
 ingestion:
   host: test-ingestion.example.com
   port: 9001
@@ -155,28 +197,33 @@ annotation:
   host: test-annotation.example.com
   port: 9003
 """
-        
+    
+    @classmethod
+    def setUpClass(cls):
+        """Write the YAML configuration file once, for all tests in the class."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
+            f.write(cls.YAML_CONTENT)
+        cls.config_path = f.name
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the YAML configuration file."""
+        os.unlink(cls.config_path)
+    
+    def test_config_from_yaml_file(self):
+        """Test loading MldpClient from YAML configuration."""
+        with patch('grpc.insecure_channel') as mock_insecure_channel:
+            mock_insecure_channel.return_value = Mock()
             
-            try:
-                with patch('grpc.insecure_channel') as mock_insecure_channel:
-                    mock_insecure_channel.return_value = Mock()
-                    
-                    client = MldpClient(config_file=f.name)
-                    
-                    # Verify channels were created with correct connection strings
-                    expected_calls = [
-                        unittest.mock.call('test-ingestion.example.com:9001'),
-                        unittest.mock.call('test-query.example.com:9002'),
-                        unittest.mock.call('test-annotation.example.com:9003')
-                    ]
-                    mock_insecure_channel.assert_has_calls(expected_calls, any_order=True)
-                    
-            finally:
-                os.unlink(f.name)
-
+            client = MldpClient(config_file=self.config_path)
+            
+            # Verify channels were created with correct connection strings
+            expected_calls = [
+                unittest.mock.call('test-ingestion.example.com:9001', options=list(DEFAULT_CHANNEL_OPTIONS.items())),
+                unittest.mock.call('test-query.example.com:9002', options=list(DEFAULT_CHANNEL_OPTIONS.items())),
+                unittest.mock.call('test-annotation.example.com:9003', options=list(DEFAULT_CHANNEL_OPTIONS.items()))
+            ]
+            mock_insecure_channel.assert_has_calls(expected_calls, any_order=True)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file